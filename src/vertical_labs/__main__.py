@@ -0,0 +1,6 @@
+"""Module entry point for ``python -m vertical_labs``."""
+
+from vertical_labs.main import main
+
+if __name__ == "__main__":
+    main()
@@ -1,110 +1,176 @@
 """Streamlit dashboard for CrewAI content generation."""
 
+import math
+import os
+import queue
+import re
+import threading
 from typing import List
 
+import orjson
+import pandas as pd
 import streamlit as st
 from dotenv import load_dotenv
 
 from vertical_labs.main import kickoff
-
-# Load environment variables
-load_dotenv()
-
-
-def initialize_session_state():
-    """Initialize session state variables."""
-    if "step" not in st.session_state:
-        st.session_state.step = 1  # 1: Initial Input, 2: Topics, 3: Pitches, 4: Content
-    if "progress" not in st.session_state:
-        st.session_state.progress = {
-            "topics": {"status": "Not Started", "details": []},
-            "content": {"status": "Not Started", "details": []},
-            "pitches": {"status": "Not Started", "details": []},
-        }
-    if "selected_topics" not in st.session_state:
-        st.session_state.selected_topics = []
-    if "selected_pitches" not in st.session_state:
-        st.session_state.selected_pitches = []
-    if "agent_messages" not in st.session_state:
-        st.session_state.agent_messages = []
-    if "terminal_output" not in st.session_state:
-        st.session_state.terminal_output = []
-
-
-def show_step_indicator():
-    """Display the current step in the process."""
-    steps = {
-        1: "Publisher Analysis",
-        2: "Topic Selection",
-        3: "Pitch Selection",
-        4: "Content Generation",
+from vertical_labs.ui.components import (
+    fragment,
+    initialize_session_state,
+    show_agent_conversation,
+    show_progress,
+    show_step_indicator,
+    update_progress,
+)
+
+# Load environment variables once per process; Streamlit re-executes this
+# module on every rerun, so guard against rescanning the filesystem.
+if not os.environ.get("_VL_ENV_LOADED"):
+    load_dotenv()
+    os.environ["_VL_ENV_LOADED"] = "1"
+
+# Compiled once at module load; splits comma- or newline-separated form
+# fields in the hot submit path.
+_LINE_SPLIT = re.compile(r"\s*[,\r\n]+\s*")
+
+
+def _lines(s: str) -> List[str]:
+    """Split a comma/newline separated field into trimmed non-empty items."""
+    if not s:
+        return [""]
+    return [item for item in _LINE_SPLIT.split(s.strip()) if item]
+
+
+@st.cache_resource
+def get_crews():
+    """Build the CrewAI crews once per process and reuse them across reruns.
+
+    Crew construction parses the agent/task YAML configs and warms up the
+    LLM clients, which costs seconds on every Streamlit rerun if done inline.
+    """
+    from vertical_labs.crews.content.content_crew import ContentAICrew
+    from vertical_labs.crews.pitch.pitch_crew import PitchAICrew
+    from vertical_labs.crews.topics.topics_crew import TopicsAICrew
+
+    return {
+        "topics": TopicsAICrew(),
+        "content": ContentAICrew(),
+        "pitch": PitchAICrew(),
     }
 
-    cols = st.columns(len(steps))
-    for step_num, step_name in steps.items():
-        with cols[step_num - 1]:
-            if step_num == st.session_state.step:
-                st.markdown(f"**:blue[{step_name}]**")
-            elif step_num < st.session_state.step:
-                st.markdown(f"~~{step_name}~~")
-            else:
-                st.markdown(step_name)
-
-
-def update_progress(stage: str, status: str, detail: str):
-    """Update the progress state in Streamlit."""
-    if stage in st.session_state.progress:
-        st.session_state.progress[stage]["status"] = status
-        st.session_state.progress[stage]["details"].append(detail)
-
-        # Add agent message to conversation
-        if "Agent:" in detail:
-            agent_name = detail.split("Agent:")[1].split("\n")[0].strip()
-            message = detail.split("Task:")[1].strip() if "Task:" in detail else detail
-            st.session_state.agent_messages.append(
-                {"agent": agent_name, "message": message}
-            )
-
-
-def show_agent_conversation():
-    """Display the agent conversation in a chat-like interface."""
-    st.header("Agent Conversation")
 
-    for msg in st.session_state.agent_messages:
-        with st.chat_message(msg["agent"]):
-            st.write(msg["message"])
-
-
-def show_progress():
-    """Show the progress sidebar."""
-    st.header("Progress")
-
-    # Topics Progress
-    st.subheader("Topics Discovery")
-    st.write(f"Status: {st.session_state.progress['topics']['status']}")
-    if st.session_state.progress["topics"]["details"]:
-        for detail in st.session_state.progress["topics"]["details"]:
-            st.write(f"- {detail}")
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_kickoff(
+    publisher_name: str,
+    publisher_url: str,
+    categories: tuple,
+    audience: str,
+    locations: tuple,
+    _progress_callback=None,
+    _crews=None,
+):
+    """Memoize full pipeline runs keyed by the publisher form values.
+
+    Submitting the same publisher twice returns the cached result instead of
+    re-spending LLM tokens on an identical pipeline. Leading-underscore
+    arguments are excluded from the cache key.
+    """
+    return kickoff(
+        publisher_name=publisher_name,
+        publisher_url=publisher_url,
+        publisher_categories=list(categories),
+        publisher_audience=audience,
+        publisher_locations=list(locations),
+        progress_callback=_progress_callback,
+        crews=_crews,
+    )
+
+
+def _session_crews():
+    """Session-level handle on the process-wide crew singletons."""
+    if "crews" not in st.session_state:
+        st.session_state.crews = get_crews()
+    return st.session_state.crews
+
+
+def _run_pipeline_in_background(publisher_name: str, publisher_url: str):
+    """Start the pipeline in a worker thread, streaming progress via a queue.
+
+    Session state must not be mutated from a non-script thread, so the
+    progress callback only enqueues events; _poll_pipeline drains them from
+    the script thread while the UI keeps rendering.
+    """
+    progress_q: queue.Queue = queue.Queue()
+    outcome: dict = {"results": None, "error": None}
+    # Resolve the cached crews on the script thread; Streamlit caching must
+    # not be touched from the worker thread.
+    crews = _session_crews()
+
+    def progress_callback(stage: str, status: str, detail: str):
+        progress_q.put((stage, status, detail))
+
+    def _worker():
+        try:
+            outcome["results"] = _cached_kickoff(
+                publisher_name,
+                publisher_url,
+                tuple(sorted(_lines("Technology, Startups, AI/ML"))),
+                "",
+                tuple(sorted(_lines("Global"))),
+                _progress_callback=progress_callback,
+                _crews=crews,
+            )
+        except Exception as e:  # Surfaced by _poll_pipeline
+            outcome["error"] = e
+
+    worker = threading.Thread(target=_worker, daemon=True)
+    worker.start()
+    st.session_state.pipeline = {
+        "queue": progress_q,
+        "worker": worker,
+        "outcome": outcome,
+    }
 
-    # Content Progress
-    st.subheader("Content Generation")
-    st.write(f"Status: {st.session_state.progress['content']['status']}")
-    if st.session_state.progress["content"]["details"]:
-        for detail in st.session_state.progress["content"]["details"]:
-            st.write(f"- {detail}")
 
-    # Pitches Progress
-    st.subheader("Pitch Creation")
-    st.write(f"Status: {st.session_state.progress['pitches']['status']}")
-    if st.session_state.progress["pitches"]["details"]:
-        for detail in st.session_state.progress["pitches"]["details"]:
-            st.write(f"- {detail}")
+@fragment(run_every=0.5)
+def _poll_pipeline():
+    """Drain queued progress events and finish up when the worker is done."""
+    pipeline = st.session_state.get("pipeline")
+    if not pipeline:
+        return
+
+    while not pipeline["queue"].empty():
+        stage, status, detail = pipeline["queue"].get_nowait()
+        update_progress(stage, status, detail)
+        st.session_state.terminal_output.append(detail)
+
+    if st.session_state.terminal_output:
+        st.code(st.session_state.terminal_output[-1])
+
+    if not pipeline["worker"].is_alive():
+        outcome = pipeline["outcome"]
+        del st.session_state["pipeline"]
+        if outcome["error"] is not None:
+            # The rerun below discards anything rendered here, so the
+            # failure goes into session state and publisher_input shows
+            # it on the next script run.
+            st.session_state.pipeline_error = (
+                f"An error occurred: {str(outcome['error'])}"
+            )
+        else:
+            st.session_state.results = outcome["results"]
+            st.session_state.step = 2  # Move to topic selection
+        st.rerun()
 
 
 def publisher_input():
     """Show the initial publisher input form."""
     st.header("Publisher Information")
 
+    # Failure recorded by _poll_pipeline before its rerun; popped so it
+    # shows once rather than on every subsequent render.
+    if "pipeline_error" in st.session_state:
+        st.error(st.session_state.pop("pipeline_error"))
+
     with st.form("publisher_form"):
         publisher_name = st.text_input(
             "Publisher Name", help="Enter the name of the publisher"
@@ -123,50 +189,24 @@ def publisher_input():
                 "pitches": {"status": "Not Started", "details": []},
             }
             st.session_state.agent_messages = []
-
-            # Create a placeholder for terminal output
-            terminal_output = st.empty()
-
-            with st.spinner("Analyzing publisher website..."):
-                try:
-                    # Start with topics discovery
-                    st.session_state.progress["topics"]["status"] = "In Progress"
-                    st.session_state.progress["topics"]["details"].append(
-                        "Starting publisher analysis..."
-                    )
-
-                    def split_to_list(s: str) -> List[str]:
-                        if not s:
-                            return [""]
-                        return [item.strip() for item in s.split(",") if item.strip()]
-
-                    # Custom callback for terminal output
-                    def progress_callback(stage: str, status: str, detail: str):
-                        update_progress(stage, status, detail)
-                        # Update terminal output
-                        terminal_output.code(detail)
-
-                    results = kickoff(
-                        publisher_name=publisher_name,
-                        publisher_url=publisher_url,
-                        publisher_categories=split_to_list(
-                            "Technology, Startups, AI/ML"
-                        ),
-                        publisher_audience="",
-                        publisher_locations=split_to_list("Global"),
-                        progress_callback=progress_callback,
-                    )
-
-                    st.session_state.results = results
-                    st.session_state.step = 2  # Move to topic selection
-                    st.rerun()
-
-                except Exception as e:
-                    st.error(f"An error occurred: {str(e)}")
+            st.session_state.terminal_output = []
+            st.session_state.progress["topics"]["status"] = "In Progress"
+            st.session_state.progress["topics"]["details"].append(
+                "Starting publisher analysis..."
+            )
+            _run_pipeline_in_background(publisher_name, publisher_url)
         elif submitted:
             st.error("Please fill in both Publisher Name and Website URL")
 
+    if st.button("Force refresh", help="Clear cached pipeline results"):
+        _cached_kickoff.clear()
 
+    if "pipeline" in st.session_state:
+        st.info("Analyzing publisher website...")
+        _poll_pipeline()
+
+
+@fragment
 def topic_selection():
     """Show the topic selection interface."""
     st.header("Select Topics to Develop")
@@ -174,17 +214,31 @@ def topic_selection():
     if "results" in st.session_state and st.session_state.results.topics:
         topics = st.session_state.results.topics
 
-        # Create checkboxes for each topic
-        selected_topics = []
-        for topic in topics:
-            col1, col2 = st.columns([0.1, 0.9])
-            with col1:
-                if st.checkbox("", key=f"topic_{topic.title}"):
-                    selected_topics.append(topic)
-            with col2:
-                with st.expander(topic.title):
-                    st.write("**Description:**", topic.description)
-                    st.write("**Keywords:**", ", ".join(topic.keywords))
+        # Render all topics as one data editor instead of three widgets per
+        # topic; selection happens through the checkbox column.
+        df = pd.DataFrame(
+            [
+                {
+                    "select": False,
+                    "title": topic.title,
+                    "description": topic.description,
+                    "keywords": ", ".join(topic.keywords),
+                }
+                for topic in topics
+            ]
+        )
+        edited = st.data_editor(
+            df,
+            column_config={
+                "select": st.column_config.CheckboxColumn("Select", default=False)
+            },
+            disabled=["title", "description", "keywords"],
+            hide_index=True,
+            key="topic_editor",
+        )
+        selected_topics = [
+            topic for topic, chosen in zip(topics, edited["select"]) if chosen
+        ]
 
         if st.button("Generate Pitches for Selected Topics") and selected_topics:
             st.session_state.selected_topics = selected_topics
@@ -194,6 +248,7 @@ def topic_selection():
         st.info("No topics generated yet. Please analyze a publisher first.")
 
 
+@fragment
 def pitch_selection():
     """Show the pitch selection interface."""
     st.header("Select Pitches to Develop")
@@ -201,17 +256,31 @@ def pitch_selection():
     if "results" in st.session_state and st.session_state.results.pitches:
         pitches = st.session_state.results.pitches
 
-        # Create checkboxes for each pitch
-        selected_pitches = []
-        for pitch in pitches:
-            col1, col2 = st.columns([0.1, 0.9])
-            with col1:
-                if st.checkbox("", key=f"pitch_{pitch.title}"):
-                    selected_pitches.append(pitch)
-            with col2:
-                with st.expander(pitch.title):
-                    st.write("**Pitch:**", pitch.pitch)
-                    st.write("**Target Audience:**", pitch.target_audience)
+        # Same data-editor pattern as topic selection: one widget message
+        # for the whole list.
+        df = pd.DataFrame(
+            [
+                {
+                    "select": False,
+                    "title": pitch.title,
+                    "pitch": pitch.pitch,
+                    "target_audience": pitch.target_audience,
+                }
+                for pitch in pitches
+            ]
+        )
+        edited = st.data_editor(
+            df,
+            column_config={
+                "select": st.column_config.CheckboxColumn("Select", default=False)
+            },
+            disabled=["title", "pitch", "target_audience"],
+            hide_index=True,
+            key="pitch_editor",
+        )
+        selected_pitches = [
+            pitch for pitch, chosen in zip(pitches, edited["select"]) if chosen
+        ]
 
         if st.button("Generate Content for Selected Pitches") and selected_pitches:
             st.session_state.selected_pitches = selected_pitches
@@ -221,18 +290,40 @@ def pitch_selection():
         st.info("No pitches generated yet. Please select topics first.")
 
 
+@st.cache_data(show_spinner=False)
+def _metadata_json(title: str, metadata: dict) -> str:
+    """Serialize content metadata once per item instead of on every rerun."""
+    return orjson.dumps(
+        metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+@fragment
 def content_generation():
     """Show the content generation results."""
     st.header("Generated Content")
 
     if "results" in st.session_state and st.session_state.results.content_items:
-        for content in st.session_state.results.content_items:
+        items = st.session_state.results.content_items
+
+        # Rendering every 1000+ word article on each rerun dominates the
+        # step-4 refresh cost, so only the current page is materialized.
+        page_size = 10
+        pages = max(1, math.ceil(len(items) / page_size))
+        page = 1
+        if pages > 1:
+            page = st.number_input("Page", min_value=1, max_value=pages, value=1)
+
+        for content in items[(page - 1) * page_size : page * page_size]:
             with st.expander(content.title):
                 st.write("**Content:**")
                 st.markdown(content.content)
                 if content.metadata:
                     st.write("**Metadata:**")
-                    st.json(content.metadata)
+                    st.code(
+                        _metadata_json(content.title, content.metadata),
+                        language="json",
+                    )
     else:
         st.info("No content generated yet. Please select pitches first.")
 
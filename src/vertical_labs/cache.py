@@ -0,0 +1,166 @@
+"""Exact-match response cache for crew runs."""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional
+
+import orjson
+
+_ORJSON_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def stable_config(inputs: Dict) -> Dict:
+    """Render structured input values as deterministic JSON strings.
+
+    Dicts and lists interpolated into task prompts must serialize
+    byte-identically across runs, otherwise provider-side prompt-prefix
+    caches miss on every kickoff even though the context is unchanged.
+    """
+    return {
+        k: orjson.dumps(v, option=_ORJSON_OPTS).decode("utf-8")
+        if isinstance(v, (dict, list))
+        else v
+        for k, v in inputs.items()
+    }
+
+
+def hashable_inputs(inputs: Dict) -> Dict:
+    """Drop side-channel values that must not influence the cache key.
+
+    Callables (progress callbacks and the like) str()-serialize with their
+    object id, so two otherwise identical runs would never share a key if
+    they leaked into the hashed payload.
+    """
+    return {k: v for k, v in inputs.items() if not callable(v)}
+
+
+def cache_key(inputs: Dict) -> str:
+    """Build a deterministic cache key for a crew inputs dict.
+
+    Inputs are serialized with sorted keys so dict insertion order does not
+    change the key; values that are not JSON-native fall back to str().
+    """
+    payload = orjson.dumps(
+        hashable_inputs(inputs), default=str, option=_ORJSON_OPTS
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with TTL for structured crew results.
+
+    Crew runs are pure functions of their inputs dict, so a repeated run
+    with identical inputs can return the prior structured result in
+    microseconds instead of re-spending LLM tokens on the same prompts.
+    Setting the VL_CACHE_DISABLE environment variable turns every lookup
+    into a miss, which is useful when debugging prompt changes.
+
+    Setting VL_CACHE_DIR to a directory path adds a disk tier: results are
+    also written there as JSON files, so cached runs survive process
+    restarts. Disk lookups only happen on a memory miss and promote the
+    entry back into memory.
+    """
+
+    def __init__(self, maxsize: int = 1000, ttl: float = 24 * 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _disabled() -> bool:
+        return bool(os.getenv("VL_CACHE_DISABLE"))
+
+    @staticmethod
+    def _disk_dir() -> Optional[str]:
+        return os.getenv("VL_CACHE_DIR") or None
+
+    def _disk_get(self, key: str) -> Optional[Dict]:
+        """Read an entry from the disk tier, or None on miss/expiry."""
+        directory = self._disk_dir()
+        if not directory:
+            return None
+        path = os.path.join(directory, f"{key}.json")
+        try:
+            with open(path, encoding="utf-8") as handle:
+                record = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        # Disk entries outlive the process, so expiry uses wall-clock time.
+        if time.time() - record.get("stored_at", 0) > self.ttl:
+            return None
+        return record.get("value")
+
+    def _disk_put(self, key: str, value: Dict) -> None:
+        """Write an entry to the disk tier; failures are non-fatal."""
+        directory = self._disk_dir()
+        if not directory:
+            return
+        try:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"{key}.json")
+            with open(path, "w", encoding="utf-8") as handle:
+                json.dump({"stored_at": time.time(), "value": value}, handle)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached result for key, or None on miss/expiry."""
+        if self._disabled():
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if time.monotonic() - stored_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+        value = self._disk_get(key)
+        with self._lock:
+            if value is not None:
+                # Promote so the next hit is a pure dict lookup.
+                self._entries[key] = (time.monotonic(), value)
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        return value
+
+    def put(self, key: str, value: Dict) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+        if self._disabled():
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        self._disk_put(key, value)
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and current size, for logging and dashboards."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Process-wide cache shared by the three crews.
+run_cache = ResponseCache()
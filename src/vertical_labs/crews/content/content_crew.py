@@ -1,11 +1,19 @@
 """ContentAI crew implementation with self-evaluation loop."""
 
-from typing import Dict
+import asyncio
+import os
+import json
+from types import MappingProxyType
+from typing import Dict, List
 
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from dotenv import load_dotenv
+from pydantic import BaseModel
 
+from vertical_labs.cache import cache_key, run_cache, stable_config
+from vertical_labs.prefix_router import bucket_key, prefix_order
+from vertical_labs.schemas import ContentRunInputs
 from vertical_labs.tools.content_tools import (
     ContentDiversityTool,
     EditorialGuidelinesTool,
@@ -13,6 +21,34 @@ from vertical_labs.tools.content_tools import (
 
 load_dotenv()
 
+# Opt-in crew console output; see VERTICAL_LABS_VERBOSE.
+_VERBOSE = bool(int(os.getenv("VERTICAL_LABS_VERBOSE", "0")))
+
+# Shared immutable default for result lookups; avoids allocating a fresh
+# empty dict per .get() miss on every run.
+_EMPTY = MappingProxyType({})
+
+# Shared tool singletons: tool construction compiles pydantic schemas, so
+# instantiate once per process instead of once per agent per crew build.
+_EDITORIAL_TOOL = EditorialGuidelinesTool()
+_DIVERSITY_TOOL = ContentDiversityTool()
+
+
+class ContentDraft(BaseModel):
+    """Structured output of the writing task; downstream tasks consume the
+    fields directly instead of re-parsing free-form text."""
+
+    title: str
+    body: str
+    keywords: List[str] = []
+
+
+class ReviewedContent(BaseModel):
+    """Structured output of the final review task."""
+
+    title: str
+    content: str
+
 
 @CrewBase
 class ContentAICrew:
@@ -20,6 +56,25 @@ class ContentAICrew:
 
     agents_config = "config/agents.yaml"
     tasks_config = "config/tasks.yaml"
+    _crew_instance = None
+
+    def _crew(self) -> Crew:
+        """Build the crew lazily on first use and reuse it across runs."""
+        if self._crew_instance is None:
+            self._crew_instance = self.content_crew()
+        return self._crew_instance
+
+    def _crew_for_run(self) -> Crew:
+        """Crew instance safe to kick off concurrently.
+
+        kickoff mutates per-run state on the Crew (task outputs, agent
+        context), so overlapping runs each get a copy of the cached
+        instance — the approach crewai's kickoff_for_each takes — while
+        the template build cost stays paid once.
+        """
+        base = self._crew()
+        copy = getattr(base, "copy", None)
+        return copy() if copy else base
 
     @agent
     def content_researcher(self) -> Agent:
@@ -36,7 +91,7 @@ class ContentAICrew:
         return Agent(
             name="content_writer",
             config=self.agents_config["content_writer"],
-            tools=[EditorialGuidelinesTool()],
+            tools=[_EDITORIAL_TOOL],
         )
 
     @agent
@@ -45,7 +100,7 @@ class ContentAICrew:
         return Agent(
             name="content_editor",
             config=self.agents_config["content_editor"],
-            tools=[EditorialGuidelinesTool()],
+            tools=[_EDITORIAL_TOOL],
         )
 
     @agent
@@ -54,7 +109,7 @@ class ContentAICrew:
         return Agent(
             name="content_optimizer",
             config=self.agents_config["content_optimizer"],
-            tools=[ContentDiversityTool()],
+            tools=[_DIVERSITY_TOOL],
         )
 
     @agent
@@ -79,6 +134,7 @@ class ContentAICrew:
         return Task(
             name="content_writing_task",
             config=self.tasks_config["content_writing_task"],
+            output_pydantic=ContentDraft,
         )
 
     @task
@@ -103,20 +159,31 @@ class ContentAICrew:
         return Task(
             name="content_review",
             config=self.tasks_config["content_review"],
+            output_pydantic=ReviewedContent,
         )
 
     @crew
     def content_crew(self) -> Crew:
         """Crew for creating and optimizing content."""
+        tasks = self.tasks
+        # The final review pass mostly repackages the optimization output;
+        # callers that accept edited content as-is can drop the extra LLM
+        # round-trip with config["skip_review"].
+        if getattr(self, "config", None) and self.config.get("skip_review"):
+            tasks = [
+                task_obj
+                for task_obj in tasks
+                if getattr(task_obj, "name", "") != "content_review"
+            ]
         return Crew(
             name="content_crew",
             agents=self.agents,
-            tasks=self.tasks,
+            tasks=tasks,
             process=Process.sequential,
-            verbose=True,
+            verbose=_VERBOSE,
         )
 
-    def run(self, inputs: Dict) -> Dict:
+    def run(self, inputs: ContentRunInputs) -> Dict:
         """Run the content crew with the given inputs.
 
         Args:
@@ -132,22 +199,191 @@ class ContentAICrew:
                 - content: The generated content
                 - metadata: Additional metadata about the content
         """
-        # Update config with inputs
-        self.config.update(inputs)
+        # Identical inputs produce identical content; skip the LLM round-trip.
+        key = cache_key(inputs)
+        cached = run_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Per-run values travel through kickoff instead of mutating the
+        # shared config, keeping the cached crew's prompt prefix stable
+        # across calls.
+        rendered = stable_config(inputs)
 
         # Get the crew instance
-        crew_instance = self.content_crew()
+        crew_instance = self._crew()
 
         # Run the crew
-        results = crew_instance.kickoff()
+        results = crew_instance.kickoff(inputs=rendered)
 
-        # Process and structure the results
+        structured = self._structure_results(results, inputs)
+        run_cache.put(key, structured)
+        return structured
+
+    async def run_async(self, inputs: ContentRunInputs) -> Dict:
+        """Async variant of run() that keeps the caller's event loop free.
+
+        Uses CrewAI's kickoff_async when the installed version provides it;
+        otherwise the blocking kickoff runs in a worker thread so the
+        network-bound LLM calls overlap with other coroutines.
+        """
+        key = cache_key(inputs)
+        cached = run_cache.get(key)
+        if cached is not None:
+            return cached
+
+        rendered = stable_config(inputs)
+        crew_instance = self._crew_for_run()
+
+        kickoff_async = getattr(crew_instance, "kickoff_async", None)
+        if kickoff_async is not None:
+            results = await kickoff_async(inputs=rendered)
+        else:
+            results = await asyncio.to_thread(
+                crew_instance.kickoff, inputs=rendered
+            )
+
+        structured = self._structure_results(results, inputs)
+        run_cache.put(key, structured)
+        return structured
+
+    def _structure_results(self, results: Dict, inputs: Dict) -> Dict:
+        """Process and structure raw kickoff results."""
+        # When the review pass is skipped, the edited content is final.
+        content = results.get("content_review", _EMPTY).get(
+            "content", ""
+        ) or results.get("editing_task", _EMPTY).get("content", "")
+        # Fresh dicts at the result boundary: returned results get pickled
+        # and JSON-dumped by the caches, which reject a mappingproxy.
         return {
-            "title": results.get("content_writing_task", {}).get("title", ""),
-            "content": results.get("content_review", {}).get("content", ""),
+            "title": results.get("content_writing_task", _EMPTY).get("title", ""),
+            "content": content,
             "metadata": {
-                "research": results.get("content_research", {}),
-                "optimization": results.get("optimization_task", {}),
+                "research": results.get("content_research") or {},
+                "optimization": results.get("optimization_task") or {},
                 "keywords": inputs.get("keywords", []),
             },
         }
+
+    def run_batch(self, inputs_list: List[Dict], batch_size: int = 8) -> List[Dict]:
+        """Run the content crew over several topics with batched prompts.
+
+        Marshals up to ``batch_size`` topics into a single crew run (numbered
+        items, JSON-array output) so N LLM round-trips collapse to
+        ceil(N / batch_size).
+
+        Args:
+            inputs_list: One inputs dict per topic, as accepted by run().
+            batch_size: Maximum number of topics marshaled into one prompt.
+
+        Returns:
+            List of per-topic result dicts, in input order.
+        """
+        # Dispatch same-prefix topics adjacently so each batched prompt
+        # reuses one warm provider prefix; input order is restored below.
+        order = prefix_order(inputs_list)
+        ordered = [inputs_list[i] for i in order]
+        buckets = [bucket_key(item) for item in ordered]
+
+        results = []
+        start = 0
+        while start < len(ordered):
+            # Chunks must not straddle prefix buckets: the shared fields
+            # below come from chunk[0] and only hold for items with the
+            # same prefix. prefix_order sorted same-bucket items adjacent,
+            # so each chunk is a batch_size slice of one contiguous run.
+            end = start + 1
+            while (
+                end < len(ordered)
+                and end - start < batch_size
+                and buckets[end] == buckets[start]
+            ):
+                end += 1
+            chunk = ordered[start:end]
+            start = end
+            if len(chunk) == 1:
+                results.append(self.run(dict(chunk[0])))
+                continue
+
+            shared = {
+                k: v
+                for k, v in chunk[0].items()
+                if k not in ("topic", "description", "keywords")
+            }
+            items = "\n".join(
+                "Item %d: %s"
+                % (
+                    i,
+                    json.dumps(
+                        {
+                            "topic": item.get("topic", ""),
+                            "description": item.get("description", ""),
+                            "keywords": item.get("keywords", []),
+                        },
+                        sort_keys=True,
+                    ),
+                )
+                for i, item in enumerate(chunk, 1)
+            )
+            batched = dict(shared)
+            batched["topic"] = (
+                f"{len(chunk)} independent topics are listed below. Create the "
+                "content for each one and respond with a JSON array containing "
+                "one object per item, in item order, each with 'title' and "
+                f"'content' keys.\n{items}"
+            )
+            results.extend(self._split_batch_output(self.run(batched), chunk))
+
+        restored: List[Dict] = [{}] * len(results)
+        for position, original_index in enumerate(order):
+            restored[original_index] = results[position]
+        return restored
+
+    async def run_batch_async(
+        self, inputs_list: List[Dict], max_parallel: int = 5
+    ) -> List[Dict]:
+        """Run several topics concurrently with a bounded fan-out.
+
+        Unlike run_batch, which marshals topics into one prompt, this issues
+        one crew run per topic and overlaps them with asyncio.gather; the
+        semaphore caps in-flight runs to stay inside provider rate limits.
+
+        Args:
+            inputs_list: One inputs dict per topic, as accepted by run().
+            max_parallel: Maximum number of concurrent crew runs.
+
+        Returns:
+            List of per-topic result dicts, in input order.
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def _bounded_run(inputs: Dict) -> Dict:
+            async with semaphore:
+                return await self.run_async(dict(inputs))
+
+        return list(
+            await asyncio.gather(*(_bounded_run(inputs) for inputs in inputs_list))
+        )
+
+    def _split_batch_output(self, output: Dict, chunk: List[Dict]) -> List[Dict]:
+        """Split a batched crew output back into per-topic results."""
+        try:
+            parsed = json.loads(output.get("content", ""))
+        except (TypeError, ValueError):
+            parsed = None
+
+        if isinstance(parsed, list) and len(parsed) == len(chunk):
+            return [
+                {
+                    "title": item.get("title", ""),
+                    "content": item.get("content", ""),
+                    "metadata": {
+                        **output.get("metadata", {}),
+                        "keywords": inputs.get("keywords", []),
+                    },
+                }
+                for item, inputs in zip(parsed, chunk)
+            ]
+
+        # Fall back to one run per item if the model did not return the array.
+        return [self.run(dict(inputs)) for inputs in chunk]
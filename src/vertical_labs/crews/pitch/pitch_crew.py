@@ -1,11 +1,18 @@
 """PitchAI crew implementation with self-evaluation loop."""
 
-from typing import Dict
+import asyncio
+import os
+import json
+from typing import Dict, List
 
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from dotenv import load_dotenv
+from pydantic import BaseModel
 
+from vertical_labs.cache import cache_key, run_cache, stable_config
+from vertical_labs.prefix_router import bucket_key, prefix_order
+from vertical_labs.schemas import PitchRunInputs
 from vertical_labs.tools.pitch_tools import (
     BrandMatchingTool,
     PitchGeneratorTool,
@@ -14,6 +21,23 @@ from vertical_labs.tools.pitch_tools import (
 
 load_dotenv()
 
+# Opt-in crew console output, shared flag with the other crews.
+_VERBOSE = bool(int(os.getenv("VERTICAL_LABS_VERBOSE", "0")))
+
+# Shared tool singletons: tool construction compiles pydantic schemas, so
+# instantiate once per process instead of once per agent per crew build.
+_BRAND_TOOL = BrandMatchingTool()
+_PITCH_TOOL = PitchGeneratorTool()
+_OPT_TOOL = PitchOptimizationTool()
+
+
+class PitchDraft(BaseModel):
+    """Structured output of the final pitch review task."""
+
+    title: str
+    pitch: str
+    target_audience: str = ""
+
 
 @CrewBase
 class PitchAICrew:
@@ -21,6 +45,24 @@ class PitchAICrew:
 
     agents_config = "config/agents.yaml"
     tasks_config = "config/tasks.yaml"
+    _crew_instance = None
+
+    def _crew(self) -> Crew:
+        """Build the crew on first use and keep it for later runs."""
+        if self._crew_instance is None:
+            self._crew_instance = self.pitch_crew()
+        return self._crew_instance
+
+    def _crew_for_run(self) -> Crew:
+        """Copy of the cached crew for an overlapping run.
+
+        A Crew accumulates per-run state during kickoff, so the pitch
+        workers must not share one instance; copying mirrors what
+        kickoff_for_each does internally.
+        """
+        base = self._crew()
+        copy = getattr(base, "copy", None)
+        return copy() if copy else base
 
     @agent
     def brand_analyst(self) -> Agent:
@@ -28,7 +70,7 @@ class PitchAICrew:
         return Agent(
             name="brand_analyst",
             config=self.agents_config["brand_analyst"],
-            tools=[BrandMatchingTool()],
+            tools=[_BRAND_TOOL],
         )
 
     @agent
@@ -37,7 +79,7 @@ class PitchAICrew:
         return Agent(
             name="pitch_writer",
             config=self.agents_config["pitch_writer"],
-            tools=[PitchGeneratorTool()],
+            tools=[_PITCH_TOOL],
         )
 
     @agent
@@ -46,7 +88,7 @@ class PitchAICrew:
         return Agent(
             name="media_relations_specialist",
             config=self.agents_config["media_relations_specialist"],
-            tools=[PitchOptimizationTool()],
+            tools=[_OPT_TOOL],
         )
 
     @agent
@@ -87,6 +129,7 @@ class PitchAICrew:
         return Task(
             name="pitch_review",
             config=self.tasks_config["pitch_review"],
+            output_pydantic=PitchDraft,
         )
 
     @crew
@@ -97,10 +140,29 @@ class PitchAICrew:
             agents=self.agents,
             tasks=self.tasks,
             process=Process.sequential,
-            verbose=True,
+            verbose=_VERBOSE,
         )
 
-    def run(self, inputs: Dict) -> Dict:
+    def _rendered_inputs(self, inputs: PitchRunInputs) -> Dict:
+        """Deterministically rendered kickoff inputs for this crew.
+
+        The rendered dict must cover every placeholder the YAML templates
+        reference — crewai raises on the first missing key — so
+        publisher_name, brand_name, and brand_url are flattened out of
+        the publisher and brand_info dicts, empty when the caller sent
+        neither.
+        """
+        rendered = dict(inputs)
+        publisher = rendered.get("publisher") or {}
+        rendered.setdefault(
+            "publisher_name", publisher.get("publisher_name", "")
+        )
+        brand_info = rendered.get("brand_info") or {}
+        rendered.setdefault("brand_name", brand_info.get("name", ""))
+        rendered.setdefault("brand_url", brand_info.get("url", ""))
+        return stable_config(rendered)
+
+    def run(self, inputs: PitchRunInputs) -> Dict:
         """Run the PitchAI crew.
 
         Args:
@@ -113,20 +175,176 @@ class PitchAICrew:
         Returns:
             Dictionary with generated pitches and metadata
         """
-        # Update config with inputs
-        self.config.update(inputs)
+        # Identical inputs produce identical pitches; skip the LLM round-trip.
+        key = cache_key(inputs)
+        cached = run_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Per-run values are rendered deterministically and handed to
+        # kickoff rather than written into the shared config, so the cached
+        # crew keeps a byte-identical prompt prefix across runs.
+        rendered = self._rendered_inputs(inputs)
 
         # Get the crew instance
-        crew_instance = self.pitch_crew()
+        crew_instance = self._crew()
 
         # Run the crew
-        results = crew_instance.kickoff()
+        results = crew_instance.kickoff(inputs=rendered)
 
         # Process and structure the results
+        structured = self._structure_results(results)
+        run_cache.put(key, structured)
+        return structured
+
+    async def run_async(self, inputs: PitchRunInputs) -> Dict:
+        """Async variant of run() for callers already inside an event loop.
+
+        Awaits CrewAI's kickoff_async when the installed version provides
+        it; otherwise the blocking kickoff runs in a worker thread so other
+        coroutines keep making progress.
+        """
+        key = cache_key(inputs)
+        cached = run_cache.get(key)
+        if cached is not None:
+            return cached
+
+        rendered = self._rendered_inputs(inputs)
+        crew_instance = self._crew_for_run()
+
+        kickoff_async = getattr(crew_instance, "kickoff_async", None)
+        if kickoff_async is not None:
+            results = await kickoff_async(inputs=rendered)
+        else:
+            results = await asyncio.to_thread(
+                crew_instance.kickoff, inputs=rendered
+            )
+
+        structured = self._structure_results(results)
+        run_cache.put(key, structured)
+        return structured
+
+    def _structure_results(self, results: Dict) -> Dict:
+        """Process and structure raw kickoff results."""
+        # Fresh dicts at the result boundary: returned results get pickled
+        # and JSON-dumped by the caches, which reject a mappingproxy.
         return {
             "pitches": results.get("pitch_review", []),
             "metadata": {
-                "brand_matches": results.get("brand_analysis_task", {}),
-                "optimization_insights": results.get("pitch_optimization_task", {}),
+                "brand_matches": results.get("brand_analysis_task") or {},
+                "optimization_insights": results.get("pitch_optimization_task")
+                or {},
             },
         }
+
+    def run_batch(self, inputs_list: List[Dict], batch_size: int = 8) -> List[Dict]:
+        """Run the pitch crew over several content items with batched prompts.
+
+        Marshals up to ``batch_size`` content items into a single crew run
+        (numbered items, JSON-array output) so N LLM round-trips collapse to
+        ceil(N / batch_size).
+
+        Args:
+            inputs_list: One inputs dict per content item, as accepted by run().
+            batch_size: Maximum number of items marshaled into one prompt.
+
+        Returns:
+            List of per-item result dicts, in input order.
+        """
+        # Keep same-prefix items adjacent so each batched prompt reuses one
+        # warm provider prefix; input order is restored below.
+        order = prefix_order(inputs_list)
+        ordered = [inputs_list[i] for i in order]
+        buckets = [bucket_key(item) for item in ordered]
+
+        results = []
+        start = 0
+        while start < len(ordered):
+            # Chunks must not straddle prefix buckets: the shared fields
+            # below come from chunk[0] and only hold for items with the
+            # same prefix. prefix_order sorted same-bucket items adjacent,
+            # so each chunk is a batch_size slice of one contiguous run.
+            end = start + 1
+            while (
+                end < len(ordered)
+                and end - start < batch_size
+                and buckets[end] == buckets[start]
+            ):
+                end += 1
+            chunk = ordered[start:end]
+            start = end
+            if len(chunk) == 1:
+                results.append(self.run(dict(chunk[0])))
+                continue
+
+            shared = {
+                k: v
+                for k, v in chunk[0].items()
+                if k not in ("content_title", "content")
+            }
+            items = "\n".join(
+                "Item %d: %s"
+                % (
+                    i,
+                    json.dumps(
+                        {
+                            "content_title": item.get("content_title", ""),
+                            "content": item.get("content", ""),
+                        },
+                        sort_keys=True,
+                    ),
+                )
+                for i, item in enumerate(chunk, 1)
+            )
+            batched = dict(shared)
+            batched["content_title"] = f"Batch of {len(chunk)} content items"
+            batched["content"] = (
+                f"{len(chunk)} independent content items are listed below. "
+                "Create a pitch for each one and respond with a JSON array "
+                "containing one pitch object per item, in item order.\n"
+                f"{items}"
+            )
+            output = self.run(batched)
+
+            pitches = output.get("pitches")
+            if isinstance(pitches, list) and len(pitches) == len(chunk):
+                # One-element lists so every item matches run()'s contract,
+                # where "pitches" is always a list of pitch records.
+                results.extend(
+                    {"pitches": [pitch], "metadata": output.get("metadata", {})}
+                    for pitch in pitches
+                )
+            else:
+                # Fall back to one run per item if the batch could not be split.
+                results.extend(self.run(dict(inputs)) for inputs in chunk)
+
+        restored: List[Dict] = [{}] * len(results)
+        for position, original_index in enumerate(order):
+            restored[original_index] = results[position]
+        return restored
+
+    async def run_batch_async(
+        self, inputs_list: List[Dict], max_parallel: int = 5
+    ) -> List[Dict]:
+        """Run several content items concurrently with a bounded fan-out.
+
+        Issues one crew run per content item and overlaps the LLM-bound work
+        in worker threads via asyncio.gather; the semaphore caps in-flight
+        runs to stay inside provider rate limits.
+
+        Args:
+            inputs_list: One inputs dict per content item, as accepted by run().
+            max_parallel: Maximum number of concurrent crew runs.
+
+        Returns:
+            List of per-item result dicts, in input order.
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def _bounded_run(inputs: Dict) -> Dict:
+            async with semaphore:
+                return await self.run_async(dict(inputs))
+
+        return list(
+            await asyncio.gather(*(_bounded_run(inputs) for inputs in inputs_list))
+        )
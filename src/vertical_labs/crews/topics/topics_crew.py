@@ -1,5 +1,7 @@
 """TopicsAI crew implementation with self-evaluation loop."""
 
+import asyncio
+import os
 import logging
 from typing import Callable, Dict, Optional
 
@@ -7,7 +9,10 @@ from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai_tools import EXASearchTool, ScrapeWebsiteTool, SerperDevTool
 from dotenv import load_dotenv
+from pydantic import BaseModel, ConfigDict
 
+from vertical_labs.cache import cache_key, run_cache, stable_config
+from vertical_labs.schemas import TopicsRunInputs
 from vertical_labs.tools.content_tools import (
     ContentDiversityTool,
     EditorialGuidelinesTool,
@@ -15,13 +20,50 @@ from vertical_labs.tools.content_tools import (
 
 load_dotenv()
 
+# Crew console verbosity is opt-in: the rich per-step output is useful
+# when debugging prompts but measurable overhead in scripted runs.
+_VERBOSE = bool(int(os.getenv("VERTICAL_LABS_VERBOSE", "0")))
+
 search_tool = SerperDevTool()
 
+# Shared tool singletons: construction sets up HTTP clients and pydantic
+# schemas, so build each tool once per process instead of per agent and
+# again per task.
+_SCRAPE_TOOL = ScrapeWebsiteTool()
+_EXA_TOOL = EXASearchTool()
+_GUIDELINES_TOOL = EditorialGuidelinesTool()
+_DIVERSITY_TOOL = ContentDiversityTool()
+
+# Agent display names, shared by the factories and the progress log lines
+# so both sides reference the same interned strings.
+_WEBSITE_ANALYZER = "Website Analysis Expert"
+_TOPIC_RESEARCHER = "Topic Research Specialist"
+_AUDIENCE_ANALYST = "Audience Analysis Expert"
+_CONTENT_STRATEGIST = "Content Strategy Specialist"
+_QUALITY_ASSURER = "Quality Assurance Specialist"
+_TOPIC_COORDINATOR = "Topic Coordination Manager"
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class TopicsInput(BaseModel):
+    """Validated inputs for a topics crew run.
+
+    Frozen so pydantic can take its fast validation path and so a validated
+    instance can key derived-data caches; unknown keys are ignored rather
+    than rejected.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    domain: str = ""
+    target_audience: str = ""
+    publisher: Optional[Dict] = None
+    publisher_url: str = ""
+
+
 @CrewBase
 class TopicsAICrew:
     """Crew for generating and managing content topics."""
@@ -29,12 +71,67 @@ class TopicsAICrew:
     agents_config = "config/agents.yaml"
     tasks_config = "config/tasks.yaml"
     progress_callback: Optional[Callable] = None
-
-    def _update_progress(self, status: str, detail: str):
-        """Update progress through callback if available."""
-        logger.info(f"Progress Update - {status}: {detail}")
-        if self.progress_callback:
-            self.progress_callback("topics", status, detail)
+    _crew_instance: Optional[Crew] = None
+    _publisher_info_cache: Optional[Dict] = None
+
+    def _publisher_info(self, validated: TopicsInput) -> Dict:
+        """Derive publisher targeting info, cached per distinct input.
+
+        The derivation is cheap but runs on every kickoff; caching on the
+        validated model's JSON keeps repeated runs for the same publisher
+        from redoing the dict walks.
+        """
+        if self._publisher_info_cache is None:
+            self._publisher_info_cache = {}
+        key = validated.model_dump_json()
+        info = self._publisher_info_cache.get(key)
+        if info is None:
+            publisher = validated.publisher or {}
+            info = {
+                "name": publisher.get("publisher_name", "Generic Publisher"),
+                "type": (
+                    "B2B"
+                    if "B2B" in validated.target_audience.upper()
+                    else "B2C"
+                ),
+                "categories": publisher.get("categories", []),
+                "audience": validated.target_audience,
+                "locations": publisher.get("locations", []),
+            }
+            self._publisher_info_cache[key] = info
+        return info
+
+    def _crew(self) -> Crew:
+        """Build the topics crew once and reuse it on subsequent runs."""
+        if self._crew_instance is None:
+            self._crew_instance = self.topics_crew()
+        return self._crew_instance
+
+    def _crew_for_run(self) -> Crew:
+        """Copy of the cached crew for this run's kickoff.
+
+        One process-wide TopicsAICrew can serve several sessions at once
+        (the Streamlit app caches crews per process), and kickoff mutates
+        per-run state on the Crew, so each run works on a copy of the
+        cached instance, as crewai's kickoff_for_each does.
+        """
+        base = self._crew()
+        copy = getattr(base, "copy", None)
+        return copy() if copy else base
+
+    def _update_progress(
+        self, status: str, detail: str, callback: Optional[Callable] = None
+    ):
+        """Update progress through callback if available.
+
+        run() hands its callback in per call rather than storing it on the
+        instance, which may be shared across sessions; the instance-level
+        attribute only backs the factory-time _log_agent_task calls.
+        """
+        logger.info("Progress Update - %s: %s", status, detail)
+        callback = callback or self.progress_callback
+        if callback:
+            callback("topics", status, detail)
 
     def _log_agent_task(self, agent_name: str, task_description: str):
         """Log agent task through progress callback."""
@@ -47,9 +144,9 @@ class TopicsAICrew:
         """Agent for analyzing publisher websites."""
         logger.info("Creating Website Analysis Expert agent")
         return Agent(
-            name="Website Analysis Expert",
+            name=_WEBSITE_ANALYZER,
             config=self.agents_config["website_analyzer"],
-            tools=[ScrapeWebsiteTool, EXASearchTool],
+            tools=[_SCRAPE_TOOL, _EXA_TOOL],
         )
 
     @agent
@@ -57,9 +154,9 @@ class TopicsAICrew:
         """Agent for researching topics."""
         logger.info("Creating Topic Research Specialist agent")
         return Agent(
-            name="Topic Research Specialist",
+            name=_TOPIC_RESEARCHER,
             config=self.agents_config["topic_researcher"],
-            tools=[EXASearchTool],
+            tools=[_EXA_TOOL],
         )
 
     @agent
@@ -67,7 +164,7 @@ class TopicsAICrew:
         """Agent for analyzing audience needs."""
         logger.info("Creating Audience Analysis Expert agent")
         return Agent(
-            name="Audience Analysis Expert",
+            name=_AUDIENCE_ANALYST,
             config=self.agents_config["audience_analyst"],
             tools=[],
         )
@@ -77,9 +174,9 @@ class TopicsAICrew:
         """Agent for strategic topic planning."""
         logger.info("Creating Content Strategy Specialist agent")
         return Agent(
-            name="Content Strategy Specialist",
+            name=_CONTENT_STRATEGIST,
             config=self.agents_config["content_strategist"],
-            tools=[EditorialGuidelinesTool],
+            tools=[_GUIDELINES_TOOL],
         )
 
     @agent
@@ -87,9 +184,9 @@ class TopicsAICrew:
         """Agent for ensuring topic quality."""
         logger.info("Creating Quality Assurance Specialist agent")
         return Agent(
-            name="Quality Assurance Specialist",
+            name=_QUALITY_ASSURER,
             config=self.agents_config["quality_assurer"],
-            tools=[ContentDiversityTool],
+            tools=[_DIVERSITY_TOOL],
         )
 
     @agent
@@ -97,7 +194,7 @@ class TopicsAICrew:
         """Agent for coordinating topic generation."""
         logger.info("Creating Topic Coordination Manager agent")
         return Agent(
-            name="Topic Coordination Manager",
+            name=_TOPIC_COORDINATOR,
             config=self.agents_config["topic_coordinator"],
         )
 
@@ -106,19 +203,17 @@ class TopicsAICrew:
         """Task for analyzing publisher website."""
         logger.info("Starting website analysis task")
         self._log_agent_task(
-            "Website Analysis Expert",
+            _WEBSITE_ANALYZER,
             "Analyzing publisher website to understand content strategy, audience, and topics.",
         )
 
-        # Format the task config with the actual publisher URL
-        task_config = self.tasks_config["website_analysis_task"].copy()
-        task_config["description"] = task_config["description"].format(
-            publisher_url=self.config.get("publisher_url", "")
-        )
+        # {publisher_url} is filled in per run by kickoff interpolation,
+        # so the YAML config is used as-is instead of being pre-formatted
+        # with whichever publisher happened to seed the shared config.
         return Task(
             name="website_analysis_task",
-            config=task_config,
-            tools=[ScrapeWebsiteTool, EXASearchTool],
+            config=self.tasks_config["website_analysis_task"],
+            tools=[_SCRAPE_TOOL, _EXA_TOOL],
         )
 
     @task
@@ -126,13 +221,13 @@ class TopicsAICrew:
         """Task for establishing content guidelines."""
         logger.info("Starting guidelines task")
         self._log_agent_task(
-            "Content Strategy Specialist",
+            _CONTENT_STRATEGIST,
             "Developing content guidelines based on website analysis.",
         )
         return Task(
             name="guidelines_task",
             config=self.tasks_config["guidelines_task"],
-            tools=[EditorialGuidelinesTool],
+            tools=[_GUIDELINES_TOOL],
         )
 
     @task
@@ -140,13 +235,13 @@ class TopicsAICrew:
         """Task for researching current trends."""
         logger.info("Starting trends research task")
         self._log_agent_task(
-            "Topic Research Specialist",
+            _TOPIC_RESEARCHER,
             "Researching current trends and topics in the publisher's domain.",
         )
         return Task(
             name="trends_research_task",
             config=self.tasks_config["trends_research_task"],
-            tools=[EXASearchTool],
+            tools=[_EXA_TOOL],
         )
 
     @task
@@ -154,12 +249,19 @@ class TopicsAICrew:
         """Task for generating topics."""
         logger.info("Starting topic generation task")
         self._log_agent_task(
-            "Content Strategy Specialist",
+            _CONTENT_STRATEGIST,
             "Generating initial topic ideas based on research and guidelines.",
         )
+        # Explicit fan-in over the three research tasks, mirroring the
+        # context declared in tasks.yaml.
         return Task(
             name="topic_generation_task",
             config=self.tasks_config["topic_generation_task"],
+            context=[
+                self.website_analysis_task(),
+                self.guidelines_task(),
+                self.trends_research_task(),
+            ],
         )
 
     @task
@@ -167,13 +269,13 @@ class TopicsAICrew:
         """Task for checking topic diversity."""
         logger.info("Starting diversity check task")
         self._log_agent_task(
-            "Quality Assurance Specialist",
+            _QUALITY_ASSURER,
             "Evaluating topic diversity and ensuring content balance.",
         )
         return Task(
             name="diversity_check_task",
             config=self.tasks_config["diversity_check_task"],
-            tools=[ContentDiversityTool],
+            tools=[_DIVERSITY_TOOL],
         )
 
     @task
@@ -181,7 +283,7 @@ class TopicsAICrew:
         """Task for final compilation of topics."""
         logger.info("Starting final compilation task")
         self._log_agent_task(
-            "Topic Coordination Manager", "Compiling and prioritizing final topic list."
+            _TOPIC_COORDINATOR, "Compiling and prioritizing final topic list."
         )
         return Task(
             name="final_compilation_task",
@@ -197,49 +299,102 @@ class TopicsAICrew:
             agents=self.agents,
             tasks=self.tasks,
             process=Process.sequential,
-            verbose=True,
+            verbose=_VERBOSE,
         )
 
-    def run(self, inputs: Dict) -> Dict:
-        """Run the topics crew with the given inputs."""
+    def run(
+        self, inputs: TopicsRunInputs, *, progress_callback: Optional[Callable] = None
+    ) -> Dict:
+        """Run the topics crew with the given inputs.
+
+        The progress callback travels as a keyword argument rather than an
+        inputs key so the cacheable inputs stay free of callables.
+        """
         logger.info("Starting topics crew run")
+        # Keep accepting the legacy inputs key from older call sites. The
+        # callback stays a run-local so concurrent sessions sharing this
+        # instance cannot clobber each other's observer.
+        callback = progress_callback or inputs.pop("progress_callback", None)
         try:
-            # Store progress callback if provided
-            self.progress_callback = inputs.pop("progress_callback", None)
+            # Identical inputs produce identical topics; skip the LLM round-trip.
+            key = cache_key(inputs)
+            cached = run_cache.get(key)
+            if cached is not None:
+                self._update_progress(
+                    "Complete", "Returning cached topics", callback
+                )
+                return cached
 
-            self._update_progress("In Progress", "Starting publisher analysis")
+            self._update_progress(
+                "In Progress", "Starting publisher analysis", callback
+            )
             logger.info("Publisher analysis starting")
 
-            # Update config with inputs
-            self.config.update(inputs)
-            logger.info("Config updated with inputs")
+            # Validate inputs once and render the values deterministically
+            # so prompt prefixes stay byte-identical across runs. The
+            # rendered dict goes to kickoff for per-run interpolation and
+            # must cover every placeholder the YAML templates reference —
+            # crewai raises on the first missing key — so publisher_name
+            # (plus the {publisherName} spelling the trends task uses) is
+            # flattened out of the publisher dict.
+            validated = TopicsInput(**inputs)
+            render_inputs = validated.model_dump()
+            render_inputs["publisher_info"] = self._publisher_info(validated)
+            publisher = validated.publisher or {}
+            render_inputs["publisher_name"] = publisher.get(
+                "publisher_name", ""
+            )
+            render_inputs["publisherName"] = render_inputs["publisher_name"]
+            rendered = stable_config(render_inputs)
+            logger.info("Inputs rendered for kickoff")
 
             # Get the crew instance
             logger.info("Getting crew instance")
-            crew_instance = self.topics_crew()
+            crew_instance = self._crew_for_run()
 
             self._update_progress(
-                "In Progress", "Analyzing website and generating topics"
+                "In Progress", "Analyzing website and generating topics", callback
             )
             logger.info("Starting crew kickoff")
 
             # Run the crew
-            results = crew_instance.kickoff()
+            results = crew_instance.kickoff(inputs=rendered)
             logger.info("Crew kickoff completed")
 
-            self._update_progress("Complete", "Topic generation completed")
+            self._update_progress(
+                "Complete", "Topic generation completed", callback
+            )
             logger.info("Topic generation completed successfully")
 
-            # Process and structure the results
-            return {
+            # Process and structure the results. Fresh dicts at the result
+            # boundary: returned results get pickled and JSON-dumped by the
+            # caches, which reject a mappingproxy.
+            structured = {
                 "topics": results.get("final_compilation_task", []),
                 "metadata": {
-                    "guidelines": results.get("guidelines_task", {}),
+                    "guidelines": results.get("guidelines_task") or {},
                     "trends": results.get("trends_research_task", []),
-                    "analysis": results.get("website_analysis_task", {}),
+                    "analysis": results.get("website_analysis_task") or {},
                 },
             }
+            run_cache.put(key, structured)
+            return structured
         except Exception as e:
-            logger.error(f"Error in topics crew run: {str(e)}", exc_info=True)
-            self._update_progress("Error", f"Error in topic generation: {str(e)}")
+            logger.error("Error in topics crew run: %s", e, exc_info=True)
+            self._update_progress(
+                "Error", f"Error in topic generation: {str(e)}", callback
+            )
             raise
+
+    async def run_async(
+        self, inputs: TopicsRunInputs, *, progress_callback: Optional[Callable] = None
+    ) -> Dict:
+        """Async variant of run() for callers already inside an event loop.
+
+        The sync run() carries the progress-callback, validation, and cache
+        plumbing, so it is offloaded wholesale to a worker thread rather
+        than re-implemented around kickoff_async.
+        """
+        return await asyncio.to_thread(
+            self.run, dict(inputs), progress_callback=progress_callback
+        )
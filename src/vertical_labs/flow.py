@@ -0,0 +1,355 @@
+"""Vertical Labs flow wiring the topics, content, and pitch crews together."""
+
+import asyncio
+import os
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional
+
+import orjson
+from crewai.flow.flow import Flow, listen, start
+
+from vertical_labs.schemas import (
+    PITCH_LIST_ADAPTER,
+    TOPIC_LIST_ADAPTER,
+    ContentItem,
+    Topic,
+    VerticalLabsState,
+)
+
+# Upper bound on concurrent crew runs per stage; keeps the fan-out inside
+# provider rate limits.
+MAX_PARALLEL = int(os.getenv("VL_MAX_PARALLEL", "5"))
+
+# Static config fields common to all three crews, hoisted so _init_crews
+# does not rebuild them each time a flow step calls it.
+_CREW_CONFIG_BASE = {
+    "agents_config": "agents.yaml",
+    "tasks_config": "tasks.yaml",
+}
+
+
+class VerticalLabsFlow(Flow[VerticalLabsState]):
+    initial_state = VerticalLabsState
+
+    def __init__(
+        self,
+        progress_callback: Optional[Callable] = None,
+        crews: Optional[Dict] = None,
+    ):
+        super().__init__()
+        # Initialize crews with proper configuration paths. Callers may pass
+        # pre-built crews (e.g. cached by the Streamlit app) to skip the
+        # expensive agent/tool construction on every flow.
+        crews = crews or {}
+        self.topics_crew = crews.get("topics")
+        self.content_crew = crews.get("content")
+        self.pitch_crew = crews.get("pitch")
+        self.progress_callback = progress_callback
+        self._publisher_block_cache: Optional[str] = None
+        self._publisher_dict_cache: Optional[Dict] = None
+        self._crews_initialized = False
+        self._stable_prefix: Mapping = MappingProxyType({})
+        # Hands finished content items from generate_content to the pitch
+        # workers so the two stages overlap instead of running back to back.
+        self._content_queue: asyncio.Queue = asyncio.Queue()
+
+    def _publisher_block(self) -> Optional[str]:
+        """Serialized publisher block shared by every crew prompt.
+
+        Rendered once with sorted keys so all crews receive byte-identical
+        publisher context, which keeps provider-side prompt-prefix caches
+        warm across the pipeline's LLM calls.
+        """
+        if self._publisher_block_cache is None and self.state.publisher:
+            self._publisher_block_cache = orjson.dumps(
+                self._publisher_dict(), option=orjson.OPT_SORT_KEYS
+            ).decode("utf-8")
+        return self._publisher_block_cache
+
+    def _publisher_dict(self) -> Optional[Dict]:
+        """Publisher state dumped once per flow.
+
+        The publisher never changes after _build_flow populates it, so the
+        pydantic serialization is paid a single time instead of once per
+        crew config and per item run.
+        """
+        if self._publisher_dict_cache is None and self.state.publisher:
+            self._publisher_dict_cache = self.state.publisher.model_dump(
+                mode="python"
+            )
+        return self._publisher_dict_cache
+
+    def _update_progress(self, stage: str, status: str, detail: str):
+        """Update progress through callback if available.
+
+        Inside the running flow loop the callback is handed off to the
+        default executor, so an observer that does I/O (webhook, DB write,
+        UI rerun) cannot stall the generation coroutines.
+        """
+        if not self.progress_callback:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.progress_callback(stage, status, detail)
+        else:
+            loop.run_in_executor(
+                None, self.progress_callback, stage, status, detail
+            )
+
+    def _init_crews(self):
+        """Initialize crews with proper configuration.
+
+        Called at the top of every flow step; after the first call it is a
+        single attribute check, since the crews and their configs do not
+        change within a flow run.
+        """
+        if self._crews_initialized:
+            return
+        # Imported here rather than at module top: the crew modules drag in
+        # crewai and the tool SDKs (hundreds of ms), which entry points like
+        # plot() never need.
+        from vertical_labs.crews.content.content_crew import ContentAICrew
+        from vertical_labs.crews.pitch.pitch_crew import PitchAICrew
+        from vertical_labs.crews.topics.topics_crew import TopicsAICrew
+
+        # Shared fields every per-item run sends. Built once and spread
+        # first into each inputs dict so the stable part of the prompt is a
+        # common prefix across topics and pitches, which is what provider
+        # prompt caches key on.
+        self._stable_prefix = MappingProxyType(
+            {
+                "publisher": self._publisher_dict(),
+                "target_audience": self.state.target_audience,
+                "content_goals": self.state.content_goals,
+            }
+        )
+
+        # Fields every crew config shares, built once per call.
+        shared_config = {
+            **_CREW_CONFIG_BASE,
+            "publisher": self._publisher_dict(),
+            "publisher_block": self._publisher_block(),
+            "progress_callback": self.progress_callback,
+        }
+
+        if not self.topics_crew:
+            self.topics_crew = TopicsAICrew()
+        self.topics_crew.config = {
+            **shared_config,
+            "domain": self.state.domain,
+            "target_audience": self.state.target_audience,
+        }
+
+        if not self.content_crew:
+            self.content_crew = ContentAICrew()
+        self.content_crew.config = {
+            **shared_config,
+            "content_goals": self.state.content_goals,
+        }
+
+        if not self.pitch_crew:
+            self.pitch_crew = PitchAICrew()
+        self.pitch_crew.config = {
+            **shared_config,
+            "target_audience": self.state.target_audience,
+        }
+
+        self._crews_initialized = True
+
+    @start()
+    async def discover_topics(self):
+        """Start the topic discovery process."""
+        self._update_progress("topics", "In Progress", "Starting Topics Discovery")
+        print("Starting Topics Discovery")
+        self._init_crews()
+        self._content_queue = asyncio.Queue()
+
+        try:
+            # The callback travels as a keyword so the inputs dict stays
+            # purely data and hashes the same regardless of which callback
+            # object the caller wired up. run_async keeps the event loop
+            # free for progress callbacks during the LLM-bound kickoff.
+            result = await self.topics_crew.run_async(
+                {
+                    "domain": self.state.domain,
+                    "target_audience": self.state.target_audience,
+                    "publisher": self._publisher_dict(),
+                },
+                progress_callback=self.progress_callback,
+            )
+
+            # Convert dictionary topics to Topic objects in one bulk pass
+            topics = TOPIC_LIST_ADAPTER.validate_python(result["topics"])
+
+            # Drop near-duplicate topics up front: every duplicate that
+            # survives here costs a full content crew run downstream.
+            seen = set()
+            unique_topics = []
+            for topic in topics:
+                fingerprint = (
+                    topic.title.lower().strip(),
+                    frozenset(keyword.lower() for keyword in topic.keywords),
+                )
+                if fingerprint not in seen:
+                    seen.add(fingerprint)
+                    unique_topics.append(topic)
+            if len(unique_topics) < len(topics):
+                self._update_progress(
+                    "topics",
+                    "In Progress",
+                    f"Dropped {len(topics) - len(unique_topics)} duplicate topics",
+                )
+
+            self.state.topics = unique_topics
+            self._update_progress(
+                "topics", "Complete", f"Generated {len(self.state.topics)} topics"
+            )
+            return self.state.topics
+        except Exception as e:
+            self._update_progress(
+                "topics", "Error", f"Error in topic discovery: {str(e)}"
+            )
+            raise
+
+    @listen(discover_topics)
+    async def generate_content(self):
+        """Generate content for discovered topics."""
+        self._update_progress("content", "In Progress", "Starting Content Generation")
+        print("Generating Content")
+        self._init_crews()
+
+        # Nothing to fan out; release the pitch workers and skip the stage.
+        if not self.state.topics:
+            for _ in range(MAX_PARALLEL):
+                self._content_queue.put_nowait(None)
+            self.state.content_items = []
+            self._update_progress("content", "Complete", "No topics to generate for")
+            return self.state.content_items
+
+        try:
+            # Each topic is an independent LLM-bound crew run, so fan them all
+            # out concurrently instead of paying the latency cost serially;
+            # the semaphore keeps at most MAX_PARALLEL runs in flight.
+            self._update_progress(
+                "content",
+                "In Progress",
+                f"Generating content for {len(self.state.topics)} topics in parallel",
+            )
+            semaphore = asyncio.Semaphore(MAX_PARALLEL)
+
+            async def _content_for(topic: Topic) -> ContentItem:
+                async with semaphore:
+                    output = await self.content_crew.run_async(
+                        {
+                            **self._stable_prefix,
+                            "topic": topic.title,
+                            "description": topic.description,
+                            "keywords": topic.keywords,
+                        }
+                    )
+                # The content crew's _structure_results already shapes these
+                # three fields, so skip pydantic validator dispatch here.
+                content_item = ContentItem.model_construct(
+                    title=output["title"],
+                    content=output["content"],
+                    metadata=output["metadata"],
+                )
+                # Hand the finished item to the pitch stage immediately so
+                # pitching overlaps the remaining content runs.
+                await self._content_queue.put(content_item)
+                return content_item
+
+            items = await asyncio.gather(
+                *[_content_for(topic) for topic in self.state.topics],
+                return_exceptions=True,
+            )
+
+            # One failed topic should not sink the batch; report and drop it.
+            # The per-topic scan and message formatting only run when an
+            # observer is attached — without one the updates go nowhere.
+            if self.progress_callback:
+                for topic, item in zip(self.state.topics, items):
+                    if isinstance(item, BaseException):
+                        self._update_progress(
+                            "content",
+                            "Error",
+                            f"Content generation failed for '{topic.title}': {item}",
+                        )
+
+            content_items = [
+                item for item in items if not isinstance(item, BaseException)
+            ]
+
+            self.state.content_items = content_items
+            self._update_progress(
+                "content", "Complete", f"Generated {len(content_items)} content pieces"
+            )
+            return self.state.content_items
+        except Exception as e:
+            self._update_progress(
+                "content", "Error", f"Error in content generation: {str(e)}"
+            )
+            raise
+        finally:
+            # Wake every pitch worker, even when content generation failed.
+            for _ in range(MAX_PARALLEL):
+                self._content_queue.put_nowait(None)
+
+    @listen(discover_topics)
+    async def create_pitches(self):
+        """Create pitches for generated content."""
+        self._update_progress("pitches", "In Progress", "Starting Pitch Creation")
+        print("Creating Pitches")
+        self._init_crews()
+
+        try:
+            # Bind the per-item invariants once: the stable prefix and the
+            # two bound methods are the same for every queue item, so the
+            # workers skip the repeated attribute walks.
+            stable_prefix = dict(self._stable_prefix)
+            run_pitch = self.pitch_crew.run_async
+            next_item = self._content_queue.get
+
+            async def _pitch_worker() -> List[Dict]:
+                worker_outputs: List[Dict] = []
+                while True:
+                    content_item = await next_item()
+                    if content_item is None:
+                        break
+                    result = await run_pitch(
+                        {
+                            **stable_prefix,
+                            "content_title": content_item.title,
+                            "content": content_item.content,
+                        }
+                    )
+                    # run_async returns {"pitches": [...], "metadata": ...};
+                    # only the pitch records themselves go into flow state.
+                    worker_outputs.extend(result.get("pitches") or [])
+                return worker_outputs
+
+            # Consume content items as generate_content produces them, so
+            # pitching overlaps content generation instead of trailing it;
+            # each worker exits on the None sentinel pushed by the producer.
+            outputs = [
+                output
+                for worker_outputs in await asyncio.gather(
+                    *[_pitch_worker() for _ in range(MAX_PARALLEL)]
+                )
+                for output in worker_outputs
+            ]
+
+            pitches = PITCH_LIST_ADAPTER.validate_python(outputs)
+
+            self.state.pitches = pitches
+            self._update_progress(
+                "pitches", "Complete", f"Created {len(pitches)} pitches"
+            )
+            return self.state.pitches
+        except Exception as e:
+            self._update_progress(
+                "pitches", "Error", f"Error in pitch creation: {str(e)}"
+            )
+            raise
+
@@ -0,0 +1,22 @@
+"""Shared HTTP session with connection pooling for Vertical Labs.
+
+Tool calls that each build their own client pay a fresh TCP+TLS
+handshake per request. The helper here hands out one pooled session per
+process so keep-alive connections are reused across all callers.
+"""
+
+import atexit
+from typing import Optional
+
+import requests
+
+_session: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide requests.Session for synchronous tool calls."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        atexit.register(_session.close)
+    return _session
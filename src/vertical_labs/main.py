@@ -1,248 +1,77 @@
 """Main entry point for Vertical Labs."""
 
-from typing import Callable, Dict, List, Optional
-
-from crewai.flow.flow import Flow, listen, start
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field
-
-from vertical_labs.crews.content.content_crew import ContentAICrew
-from vertical_labs.crews.pitch.pitch_crew import PitchAICrew
-from vertical_labs.crews.topics.topics_crew import TopicsAICrew
-
-
-class Topic(BaseModel):
-    title: str
-    description: str
-    keywords: List[str]
-
-
-class ContentItem(BaseModel):
-    title: str
-    content: str
-    metadata: Dict
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+# Re-exported so existing callers can keep importing the models from here.
+from vertical_labs.schemas import (
+    PITCH_LIST_ADAPTER,
+    TOPIC_LIST_ADAPTER,
+    ContentItem,
+    Pitch,
+    PublisherInfo,
+    Topic,
+    VerticalLabsState,
+)
+
+if TYPE_CHECKING:
+    from vertical_labs.flow import VerticalLabsFlow
+
+
+def __getattr__(name: str):
+    """Resolve flow names lazily (PEP 562).
+
+    The flow module drags in crewai's import graph, which costs seconds of
+    cold start that entry points like --help or train() never need; it is
+    only imported when the flow is actually requested.
+    """
+    if name in ("VerticalLabsFlow", "MAX_PARALLEL"):
+        from vertical_labs import flow
 
+        return getattr(flow, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-class Pitch(BaseModel):
-    title: str
-    pitch: str
-    target_audience: str
 
+def _build_flow(
+    publisher_name: str,
+    publisher_url: str,
+    publisher_categories: List[str],
+    publisher_audience: str,
+    publisher_locations: List[str],
+    publisher_domain: str,
+    target_audience: str,
+    content_goals: str,
+    progress_callback: Optional[Callable] = None,
+    crews: Optional[Dict] = None,
+) -> "VerticalLabsFlow":
+    """Build a flow with its state populated from the publisher inputs."""
+    from vertical_labs.flow import VerticalLabsFlow
 
-class PublisherInfo(BaseModel):
-    """Publisher information for content analysis and targeting."""
+    flow = VerticalLabsFlow(progress_callback=progress_callback, crews=crews)
+    flow.state.domain = publisher_domain
+    flow.state.target_audience = target_audience
+    flow.state.content_goals = content_goals
 
-    publisher_name: str = Field(description="Name of the publisher")
-    publisher_url: str = Field(description="Publisher's website URL")
-    categories: List[str] = Field(
-        description="Content categories covered by the publisher"
-    )
-    audience: str = Field(description="Publisher's target audience")
-    locations: List[str] = Field(description="Geographic locations covered")
-    preferences: Optional[Dict] = Field(
-        default_factory=dict, description="Publisher's content preferences"
+    # Create publisher info for state
+    flow.state.publisher = PublisherInfo(
+        publisher_name=publisher_name,
+        publisher_url=publisher_url,
+        categories=publisher_categories,
+        audience=publisher_audience,
+        locations=publisher_locations,
     )
 
+    return flow
 
-class VerticalLabsState(BaseModel):
-    topics: List[Topic] = []
-    content_items: List[ContentItem] = []
-    pitches: List[Pitch] = []
-    domain: str = ""
-    target_audience: str = ""
-    content_goals: str = ""
-    publisher: Optional[PublisherInfo] = None
-
-
-class VerticalLabsFlow(Flow[VerticalLabsState]):
-    initial_state = VerticalLabsState
-
-    def __init__(self, progress_callback: Optional[Callable] = None):
-        super().__init__()
-        # Initialize crews with proper configuration paths
-        self.topics_crew = None
-        self.content_crew = None
-        self.pitch_crew = None
-        self.progress_callback = progress_callback
-
-    def _update_progress(self, stage: str, status: str, detail: str):
-        """Update progress through callback if available."""
-        if self.progress_callback:
-            self.progress_callback(stage, status, detail)
-
-    def _init_crews(self):
-        """Initialize crews with proper configuration."""
-        if not self.topics_crew:
-            self.topics_crew = TopicsAICrew()
-            self.topics_crew.config = {
-                "domain": self.state.domain,
-                "target_audience": self.state.target_audience,
-                "publisher": (
-                    self.state.publisher.model_dump() if self.state.publisher else None
-                ),
-                "agents_config": "agents.yaml",
-                "tasks_config": "tasks.yaml",
-                "progress_callback": self.progress_callback,
-            }
-
-        if not self.content_crew:
-            self.content_crew = ContentAICrew()
-            self.content_crew.config = {
-                "content_goals": self.state.content_goals,
-                "publisher": (
-                    self.state.publisher.model_dump() if self.state.publisher else None
-                ),
-                "agents_config": "agents.yaml",
-                "tasks_config": "tasks.yaml",
-                "progress_callback": self.progress_callback,
-            }
-
-        if not self.pitch_crew:
-            self.pitch_crew = PitchAICrew()
-            self.pitch_crew.config = {
-                "target_audience": self.state.target_audience,
-                "publisher": (
-                    self.state.publisher.model_dump() if self.state.publisher else None
-                ),
-                "agents_config": "agents.yaml",
-                "tasks_config": "tasks.yaml",
-                "progress_callback": self.progress_callback,
-            }
-
-    @start()
-    def discover_topics(self):
-        """Start the topic discovery process."""
-        self._update_progress("topics", "In Progress", "Starting Topics Discovery")
-        print("Starting Topics Discovery")
-        self._init_crews()
-
-        try:
-            result = self.topics_crew.run(
-                {
-                    "domain": self.state.domain,
-                    "target_audience": self.state.target_audience,
-                    "publisher": (
-                        self.state.publisher.model_dump()
-                        if self.state.publisher
-                        else None
-                    ),
-                    "progress_callback": self.progress_callback,
-                }
-            )
 
-            # Convert dictionary topics to Topic objects
-            self.state.topics = [
-                Topic(
-                    title=topic["title"],
-                    description=topic["description"],
-                    keywords=topic["keywords"],
-                )
-                for topic in result["topics"]
-            ]
-            self._update_progress(
-                "topics", "Complete", f"Generated {len(self.state.topics)} topics"
-            )
-            return self.state.topics
-        except Exception as e:
-            self._update_progress(
-                "topics", "Error", f"Error in topic discovery: {str(e)}"
-            )
-            raise
-
-    @listen(discover_topics)
-    async def generate_content(self):
-        """Generate content for discovered topics."""
-        self._update_progress("content", "In Progress", "Starting Content Generation")
-        print("Generating Content")
-        self._init_crews()
-        content_items = []
-
-        try:
-            for i, topic in enumerate(self.state.topics, 1):
-                self._update_progress(
-                    "content",
-                    "In Progress",
-                    f"Generating content for topic {i}/{len(self.state.topics)}",
-                )
-                output = self.content_crew.run(
-                    {
-                        "topic": topic.title,
-                        "description": topic.description,
-                        "keywords": topic.keywords,
-                        "content_goals": self.state.content_goals,
-                        "publisher": (
-                            self.state.publisher.model_dump()
-                            if self.state.publisher
-                            else None
-                        ),
-                        "progress_callback": self.progress_callback,
-                    }
-                )
-
-                content_item = ContentItem(
-                    title=output["title"],
-                    content=output["content"],
-                    metadata=output["metadata"],
-                )
-                content_items.append(content_item)
-
-            self.state.content_items = content_items
-            self._update_progress(
-                "content", "Complete", f"Generated {len(content_items)} content pieces"
-            )
-            return self.state.content_items
-        except Exception as e:
-            self._update_progress(
-                "content", "Error", f"Error in content generation: {str(e)}"
-            )
-            raise
-
-    @listen(discover_topics)
-    async def create_pitches(self):
-        """Create pitches for generated content."""
-        self._update_progress("pitches", "In Progress", "Starting Pitch Creation")
-        print("Creating Pitches")
-        self._init_crews()
-        pitches = []
-
-        try:
-            for i, content_item in enumerate(self.state.content_items, 1):
-                self._update_progress(
-                    "pitches",
-                    "In Progress",
-                    f"Creating pitch {i}/{len(self.state.content_items)}",
-                )
-                output = self.pitch_crew.run(
-                    {
-                        "content_title": content_item.title,
-                        "content": content_item.content,
-                        "target_audience": self.state.target_audience,
-                        "publisher": (
-                            self.state.publisher.model_dump()
-                            if self.state.publisher
-                            else None
-                        ),
-                        "progress_callback": self.progress_callback,
-                    }
-                )
-
-                pitch = Pitch(
-                    title=output["title"],
-                    pitch=output["pitch"],
-                    target_audience=output["target_audience"],
-                )
-                pitches.append(pitch)
-
-            self.state.pitches = pitches
-            self._update_progress(
-                "pitches", "Complete", f"Created {len(pitches)} pitches"
-            )
-            return self.state.pitches
-        except Exception as e:
-            self._update_progress(
-                "pitches", "Error", f"Error in pitch creation: {str(e)}"
-            )
-            raise
+DEFAULT_CONTENT_GOALS = """
+    Create thought leadership and technical analysis content that:
+    - Demonstrates expertise in enterprise-grade AI solutions
+    - Includes case studies and ROI metrics
+    - Maintains professional tone and analytical style
+    """
 
 
 def kickoff(
@@ -253,40 +82,116 @@ def kickoff(
     publisher_locations: List[str],
     publisher_domain: str = "Enterprise AI Solutions",
     target_audience: str = "B2B audience including CTOs, Tech Leaders, and Developers",
-    content_goals: str = """
-    Create thought leadership and technical analysis content that:
-    - Demonstrates expertise in enterprise-grade AI solutions
-    - Includes case studies and ROI metrics
-    - Maintains professional tone and analytical style
-    """,
+    content_goals: str = DEFAULT_CONTENT_GOALS,
     progress_callback: Optional[Callable] = None,
+    crews: Optional[Dict] = None,
 ):
     """Kickoff the Vertical Labs flow."""
-    flow = VerticalLabsFlow(progress_callback=progress_callback)
-    flow.state.domain = publisher_domain
-    flow.state.target_audience = target_audience
-    flow.state.content_goals = content_goals
+    flow = _build_flow(
+        publisher_name,
+        publisher_url,
+        publisher_categories,
+        publisher_audience,
+        publisher_locations,
+        publisher_domain,
+        target_audience,
+        content_goals,
+        progress_callback=progress_callback,
+        crews=crews,
+    )
+    return flow.kickoff()
 
-    # Create publisher info for state
-    flow.state.publisher = PublisherInfo(
-        publisher_name=publisher_name,
-        publisher_url=publisher_url,
-        categories=publisher_categories,
-        audience=publisher_audience,
-        locations=publisher_locations,
+
+async def akickoff(
+    publisher_name: str,
+    publisher_url: str,
+    publisher_categories: List[str],
+    publisher_audience: str,
+    publisher_locations: List[str],
+    publisher_domain: str = "Enterprise AI Solutions",
+    target_audience: str = "B2B audience including CTOs, Tech Leaders, and Developers",
+    content_goals: str = DEFAULT_CONTENT_GOALS,
+    progress_callback: Optional[Callable] = None,
+    crews: Optional[Dict] = None,
+):
+    """Async variant of kickoff() that does not block the caller's loop.
+
+    Accepts either a sync or an ``async def`` progress callback; async
+    callbacks are scheduled back on the running loop so UI updates render
+    while the crews are still working.
+    """
+    loop = asyncio.get_running_loop()
+
+    if progress_callback is not None and asyncio.iscoroutinefunction(
+        progress_callback
+    ):
+        async_callback = progress_callback
+
+        def progress_callback(stage: str, status: str, detail: str):
+            asyncio.run_coroutine_threadsafe(
+                async_callback(stage, status, detail), loop
+            )
+
+    flow = _build_flow(
+        publisher_name,
+        publisher_url,
+        publisher_categories,
+        publisher_audience,
+        publisher_locations,
+        publisher_domain,
+        target_audience,
+        content_goals,
+        progress_callback=progress_callback,
+        crews=crews,
     )
 
-    return flow.kickoff()
+    kickoff_async = getattr(flow, "kickoff_async", None)
+    if kickoff_async is not None:
+        return await kickoff_async()
+    return await asyncio.to_thread(flow.kickoff)
+
+
+async def kickoff_batch(configs: List[Dict], concurrency: int = 8) -> List:
+    """Run the full pipeline for many publishers concurrently.
+
+    Each config is a dict of akickoff() keyword arguments; one flow is built
+    per config and the semaphore caps how many run at once. Raise
+    concurrency with care — every flow fans out its own per-topic crew runs
+    on top of this bound, so the effective provider load is multiplicative.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(config: Dict):
+        async with semaphore:
+            return await akickoff(**config)
+
+    return list(await asyncio.gather(*(_bounded(config) for config in configs)))
+
+
+def kickoff_many(configs: List[Dict], workers: int = 16) -> List:
+    """Thread-based counterpart of kickoff_batch() for synchronous callers.
+
+    Each config is a dict of kickoff() keyword arguments. The pipelines
+    are LLM/HTTP-bound, so threads overlap their latency despite the GIL;
+    results come back in input order. The same multiplicative-load caveat
+    as kickoff_batch() applies when raising workers.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda config: kickoff(**config), configs))
 
 
 def plot():
     """Generate a visualization of the flow."""
+    from vertical_labs.flow import VerticalLabsFlow
+
     flow = VerticalLabsFlow()
     flow.plot()
 
 
 def train():
     """Train the Vertical Labs system."""
+    from vertical_labs.crews.topics.topics_crew import TopicsAICrew
+
     inputs = {
         "Publisher Name": "TechCrunch",
         "Publisher URL": "https://techcrunch.com",
@@ -300,45 +205,57 @@ def train():
         raise Exception(f"Error training topics crew: {e}")
 
 
-def main():
-    """Run the Vertical Labs system."""
-    # Load environment variables
-    load_dotenv()
+@lru_cache(maxsize=1)
+def _default_inputs() -> Dict:
+    """Example publisher inputs shared by the CLI entry points.
 
-    # Example publisher
-    publisher_name = "TechCrunch"
-    publisher_url = "https://techcrunch.com"
-    publisher_categories = ["Technology", "Startups", "AI/ML", "Enterprise"]
-    publisher_audience = "Tech professionals, entrepreneurs, investors"
-    publisher_locations = ["Global", "USA", "Europe"]
-
-    # Example domain and goals
-    publisher_domain = "Enterprise AI Solutions"
-    target_audience = """
+    Built once per process so repeated invocations skip rebuilding the
+    static dict literals.
+    """
+    return {
+        # Example publisher
+        "publisher_name": "TechCrunch",
+        "publisher_url": "https://techcrunch.com",
+        "publisher_categories": ["Technology", "Startups", "AI/ML", "Enterprise"],
+        "publisher_audience": "Tech professionals, entrepreneurs, investors",
+        "publisher_locations": ["Global", "USA", "Europe"],
+        # Example domain and goals
+        "publisher_domain": "Enterprise AI Solutions",
+        "target_audience": """
     B2B audience including CTOs, Tech Leaders, and Developers
     in Software and AI/ML industries, primarily in USA and Canada.
     Looking for professional, analytical content with data-backed insights.
-    """
-    content_goals = """
+    """,
+        "content_goals": """
     Create thought leadership and technical analysis content that:
     - Demonstrates expertise in enterprise-grade AI solutions
     - Includes case studies and ROI metrics
     - Maintains professional tone and analytical style
     - Targets content length of 1000-1500 words
     - Emphasizes human-centric design in AI implementations
-    """
+    """,
+    }
+
+
+def main():
+    """Run the Vertical Labs system."""
+    # Load environment variables
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    # Use libuv's event loop when available; the flow multiplexes many
+    # network-bound coroutines, where uvloop's lower per-syscall overhead
+    # shows up in tail latency.
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
 
     # Run the flow
-    results = kickoff(
-        publisher_name=publisher_name,
-        publisher_url=publisher_url,
-        publisher_categories=publisher_categories,
-        publisher_audience=publisher_audience,
-        publisher_locations=publisher_locations,
-        publisher_domain=publisher_domain,
-        target_audience=target_audience,
-        content_goals=content_goals,
-    )
+    results = kickoff(**_default_inputs())
 
     # Print results summary
     print("\nResults Summary:")
@@ -0,0 +1,194 @@
+"""Lightweight performance monitoring for crew runs."""
+
+import mmap
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import BinaryIO, Dict, List, Optional
+
+import orjson
+
+
+@dataclass(slots=True)
+class CrewMetrics:
+    """Timing and usage numbers for a single crew run.
+
+    Durations come from the monotonic clock as integer nanoseconds, so
+    they survive wall-clock adjustments and cost no datetime allocation;
+    the single wall-clock stamp exists only for time-window queries and
+    display.
+    """
+
+    run_id: str
+    crew_type: str
+    start_time: float = field(default_factory=time.time)
+    start_ns: int = field(default_factory=time.monotonic_ns)
+    end_ns: Optional[int] = None
+    total_tokens: int = 0
+    total_cost: float = 0.0
+    completion_rate: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Run duration in seconds, or None while still running."""
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def to_dict(self) -> Dict:
+        return {
+            "run_id": self.run_id,
+            "crew_type": self.crew_type,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "total_tokens": self.total_tokens,
+            "total_cost": self.total_cost,
+            "completion_rate": self.completion_rate,
+            "errors": self.errors,
+        }
+
+
+class PerformanceMonitor:
+    """Records per-run crew metrics to append-only JSONL files.
+
+    One file per crew type, one line per finished run. Appending a line to
+    an already-open buffered handle keeps end_monitoring() off the
+    open/close/fsync path, and queries scan a single sequential file
+    instead of globbing a directory of per-run JSON files.
+    """
+
+    def __init__(self, storage_dir: str = ".vl_metrics"):
+        self.storage_dir = Path(os.getenv("VL_METRICS_DIR", storage_dir))
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._active: Dict[str, CrewMetrics] = {}
+        self._writers: Dict[str, BinaryIO] = {}
+        # run_id -> (crew_type, byte offset of its record) for runs finished
+        # in this process, so get_metrics seeks straight to the line.
+        self._index: Dict[str, tuple] = {}
+        self._lock = Lock()
+
+    def _writer(self, crew_type: str) -> BinaryIO:
+        """Lazily opened append-mode handle for a crew type's JSONL file."""
+        writer = self._writers.get(crew_type)
+        if writer is None:
+            path = self.storage_dir / f"{crew_type}.jsonl"
+            writer = open(path, "ab", buffering=1 << 16)
+            self._writers[crew_type] = writer
+        return writer
+
+    def start_monitoring(self, run_id: str, crew_type: str) -> CrewMetrics:
+        """Begin tracking a crew run."""
+        metrics = CrewMetrics(run_id=run_id, crew_type=crew_type)
+        with self._lock:
+            self._active[run_id] = metrics
+        return metrics
+
+    def end_monitoring(
+        self,
+        run_id: str,
+        total_tokens: int = 0,
+        total_cost: float = 0.0,
+        completion_rate: float = 1.0,
+        errors: Optional[List[str]] = None,
+    ) -> Optional[CrewMetrics]:
+        """Finish tracking a run and append its record to disk."""
+        with self._lock:
+            metrics = self._active.pop(run_id, None)
+            if metrics is None:
+                return None
+            metrics.end_ns = time.monotonic_ns()
+            metrics.total_tokens = total_tokens
+            metrics.total_cost = total_cost
+            metrics.completion_rate = completion_rate
+            if errors:
+                metrics.errors = list(errors)
+            writer = self._writer(metrics.crew_type)
+            self._index[run_id] = (metrics.crew_type, writer.tell())
+            writer.write(orjson.dumps(metrics.to_dict()) + b"\n")
+        return metrics
+
+    def get_metrics(self, run_id: str) -> Optional[Dict]:
+        """Return the record for a run, or None if unknown."""
+        with self._lock:
+            active = self._active.get(run_id)
+            if active is not None:
+                return active.to_dict()
+            indexed = self._index.get(run_id)
+            self.flush()
+        if indexed is not None:
+            crew_type, offset = indexed
+            with open(self.storage_dir / f"{crew_type}.jsonl", "rb") as handle:
+                handle.seek(offset)
+                return orjson.loads(handle.readline())
+        # Runs recorded by other processes are not indexed; scan for them.
+        for path in self.storage_dir.glob("*.jsonl"):
+            with open(path, "rb") as handle:
+                for line in handle:
+                    record = orjson.loads(line)
+                    if record["run_id"] == run_id:
+                        return record
+        return None
+
+    def get_crew_stats(self, crew_type: str, hours: float = 24.0) -> Dict:
+        """Aggregate stats for a crew type over the trailing time window."""
+        cutoff = time.time() - hours * 3600.0
+        path = self.storage_dir / f"{crew_type}.jsonl"
+        with self._lock:
+            self.flush()
+        # Single fused pass, newest record first: the file appends in
+        # near-chronological order, so walking backwards lets the scan stop
+        # at the first record older than the window instead of parsing the
+        # whole history. The mmap view avoids copying stale bytes at all.
+        runs = duration_count = error_runs = total_tokens = 0
+        duration_total = completion_total = total_cost = 0.0
+        if path.exists() and path.stat().st_size:
+            with open(path, "rb") as handle, mmap.mmap(
+                handle.fileno(), 0, access=mmap.ACCESS_READ
+            ) as view:
+                end = len(view)
+                while end > 0:
+                    start = view.rfind(b"\n", 0, end - 1) + 1
+                    record = orjson.loads(view[start:end])
+                    if record["start_time"] < cutoff:
+                        break
+                    runs += 1
+                    duration = record["duration"]
+                    if duration:
+                        duration_total += duration
+                        duration_count += 1
+                    completion_total += record["completion_rate"]
+                    total_tokens += record["total_tokens"]
+                    total_cost += record["total_cost"]
+                    if record["errors"]:
+                        error_runs += 1
+                    end = start
+
+        if not runs:
+            return {"crew_type": crew_type, "runs": 0}
+
+        return {
+            "crew_type": crew_type,
+            "runs": runs,
+            "avg_duration": (
+                duration_total / duration_count if duration_count else 0.0
+            ),
+            "avg_completion_rate": completion_total / runs,
+            "total_tokens": total_tokens,
+            "total_cost": total_cost,
+            "error_runs": error_runs,
+        }
+
+    def flush(self) -> None:
+        """Flush buffered writers so readers see every finished run."""
+        for writer in self._writers.values():
+            writer.flush()
+
+    def close(self) -> None:
+        """Flush and close all writers."""
+        with self._lock:
+            for writer in self._writers.values():
+                writer.close()
+            self._writers.clear()
@@ -0,0 +1,36 @@
+"""Prefix-aware ordering for batched crew runs."""
+
+import hashlib
+import json
+from typing import Dict, List
+
+# Input keys that make up the shared prompt prefix of a crew run; per-item
+# keys (topic, content, ...) are deliberately excluded.
+PREFIX_KEYS = frozenset(
+    {
+        "brand_info",
+        "content_goals",
+        "guidelines",
+        "publisher",
+        "publishers",
+        "target_audience",
+    }
+)
+
+
+def bucket_key(inputs: Dict) -> str:
+    """Key identifying the shared prompt prefix of a crew inputs dict."""
+    shared = {k: v for k, v in inputs.items() if k in PREFIX_KEYS}
+    payload = json.dumps(shared, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def prefix_order(inputs_list: List[Dict]) -> List[int]:
+    """Indices of inputs_list reordered so same-prefix items are adjacent.
+
+    Dispatching a batch in this order keeps each shared prefix warm in the
+    provider's prompt cache for a whole bucket instead of re-prefilling it
+    every time buckets interleave. The sort is stable, so items within a
+    bucket keep their relative order.
+    """
+    return sorted(range(len(inputs_list)), key=lambda i: bucket_key(inputs_list[i]))
@@ -0,0 +1,108 @@
+"""Shared pydantic models for the Vertical Labs pipeline.
+
+Defined once here so the flow, the crews, and the UI all reuse the same
+compiled pydantic schemas instead of paying model-build cost per module.
+"""
+
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+# pydantic requires the typing_extensions TypedDict on Python < 3.12 when a
+# TypedDict appears as a model field annotation.
+from typing_extensions import TypedDict
+
+
+class ContentMeta(TypedDict, total=False):
+    """Metadata attached to a content item by the content crew."""
+
+    research: Dict
+    optimization: Dict
+    keywords: List[str]
+
+
+class TopicsRunInputs(TypedDict, total=False):
+    """Shape of the inputs dict the flow sends to TopicsAICrew.run()."""
+
+    domain: str
+    target_audience: str
+    publisher: Optional[Dict]
+    publisher_url: str
+
+
+class ContentRunInputs(TypedDict, total=False):
+    """Shape of the inputs dict the flow sends to ContentAICrew.run()."""
+
+    publisher: Optional[Dict]
+    target_audience: str
+    content_goals: str
+    topic: str
+    description: str
+    keywords: List[str]
+
+
+class PitchRunInputs(TypedDict, total=False):
+    """Shape of the inputs dict the flow sends to PitchAICrew.run()."""
+
+    publisher: Optional[Dict]
+    target_audience: str
+    content_goals: str
+    content_title: str
+    content: str
+
+
+class Topic(BaseModel):
+    title: str
+    description: str
+    keywords: List[str]
+
+
+class ContentItem(BaseModel):
+    title: str
+    content: str
+    metadata: ContentMeta
+
+
+class Pitch(BaseModel):
+    title: str
+    pitch: str
+    target_audience: str
+
+
+# Bulk list validators; one schema dispatch per batch instead of one model
+# construction per element.
+TOPIC_LIST_ADAPTER = TypeAdapter(List[Topic])
+PITCH_LIST_ADAPTER = TypeAdapter(List[Pitch])
+
+
+class PublisherInfo(BaseModel):
+    """Publisher information for content analysis and targeting."""
+
+    publisher_name: str = Field(description="Name of the publisher")
+    publisher_url: str = Field(description="Publisher's website URL")
+    categories: List[str] = Field(
+        description="Content categories covered by the publisher"
+    )
+    audience: str = Field(description="Publisher's target audience")
+    locations: List[str] = Field(description="Geographic locations covered")
+    preferences: Optional[Dict] = Field(
+        default_factory=dict, description="Publisher's content preferences"
+    )
+
+
+class VerticalLabsState(BaseModel):
+    topics: List[Topic] = []
+    content_items: List[ContentItem] = []
+    pitches: List[Pitch] = []
+    domain: str = ""
+    target_audience: str = ""
+    content_goals: str = ""
+    publisher: Optional[PublisherInfo] = None
+
+
+# Warm pydantic's JSON-schema caches at import so the first flow kickoff
+# (or a cold serverless invocation) does not pay the introspection cost
+# mid-pipeline; the models are small, so this adds little to import time.
+for _model in (Topic, ContentItem, Pitch, PublisherInfo, VerticalLabsState):
+    _model.model_json_schema()
+del _model
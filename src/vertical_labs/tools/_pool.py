@@ -0,0 +1,8 @@
+"""Shared thread pool for IO-bound tool fan-out."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Tool work is dominated by remote TTFB, so a generous thread count is safe;
+# tune with TOOL_POOL_WORKERS when provider rate limits demand it.
+TOOL_POOL = ThreadPoolExecutor(max_workers=int(os.getenv("TOOL_POOL_WORKERS", "16")))
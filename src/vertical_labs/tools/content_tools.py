@@ -1,5 +1,6 @@
 """Content analysis and generation tools for Vertical Labs crews."""
 
+import hashlib
 from typing import Dict, List, Optional
 
 from crewai.tools import BaseTool
@@ -32,6 +33,12 @@ class EditorialGuidelinesSchema(BaseModel):
     )
 
 
+# Guidelines are a pure function of the publisher info; the writer and
+# editor both request them during a single pipeline run, so results are
+# shared process-wide keyed on the serialized publisher.
+_GUIDELINES_CACHE: Dict[str, Dict] = {}
+
+
 class EditorialGuidelinesTool(BaseTool):
     """Tool for generating and managing editorial guidelines."""
 
@@ -41,7 +48,12 @@ class EditorialGuidelinesTool(BaseTool):
 
     def _run(self, publisher_info: PublisherInfo) -> Dict:
         """Run the tool with proper error handling."""
-        return self._execute(publisher_info.model_dump())
+        key = publisher_info.model_dump_json()
+        cached = _GUIDELINES_CACHE.get(key)
+        if cached is None:
+            cached = self._execute(publisher_info.model_dump())
+            _GUIDELINES_CACHE[key] = cached
+        return cached
 
     def _execute(self, publisher_info: Dict) -> Dict:
         """Run the tool to generate editorial guidelines."""
@@ -113,6 +125,11 @@ class ContentDiversitySchema(BaseModel):
     )
 
 
+# Similarity matrices keyed on the topic batch; diversity checks over the
+# same topic list within a process reuse the precomputed result.
+_SIMILARITY_CACHE: Dict[str, List[List[float]]] = {}
+
+
 class ContentDiversityTool(BaseTool):
     """Tool for ensuring content diversity and originality."""
 
@@ -120,6 +137,34 @@ class ContentDiversityTool(BaseTool):
     description: str = "Analyzes content to ensure diversity and avoid duplication"
     args_schema: type[ContentDiversitySchema] = ContentDiversitySchema
 
+    def compute_similarity(self, topics: List[str]) -> List[List[float]]:
+        """Compute the pairwise similarity matrix for a batch of topics.
+
+        Each topic is tokenized exactly once up front, so the pairwise pass
+        works on precomputed word sets instead of re-splitting both strings
+        for every pair. The matrix is cached on a hash of the batch and
+        reused across re-runs in the same process.
+        """
+        # Keyed on the batch in order: the matrix rows follow the input
+        # order, so two orderings of the same topics are distinct entries.
+        key = hashlib.sha256("\n".join(topics).encode("utf-8")).hexdigest()
+        cached = _SIMILARITY_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        word_sets = [set(topic.lower().split()) for topic in topics]
+        matrix = [[0.0] * len(topics) for _ in topics]
+        for i, words_a in enumerate(word_sets):
+            matrix[i][i] = 1.0
+            for j in range(i + 1, len(word_sets)):
+                words_b = word_sets[j]
+                union = len(words_a | words_b)
+                score = len(words_a & words_b) / union if union else 0.0
+                matrix[i][j] = matrix[j][i] = score
+
+        _SIMILARITY_CACHE[key] = matrix
+        return matrix
+
     def _run(
         self,
         content_list: List[ContentItem],
@@ -170,17 +215,24 @@ class ContentDiversityTool(BaseTool):
         return results
 
     def _cluster_topics(self, topics: List[str]) -> Dict[str, List[str]]:
-        """Group similar topics into clusters."""
-        clusters = {}
-        for topic in topics:
-            words = set(topic.lower().split())
+        """Group similar topics into clusters.
+
+        Membership checks read the pairwise matrix from compute_similarity
+        (a shared word means a non-zero score), so each topic is tokenized
+        once per batch and repeat checks over the same batch reuse the
+        cached matrix instead of re-splitting strings per comparison.
+        """
+        matrix = self.compute_similarity(topics)
+        clusters: Dict[str, List[str]] = {}
+        founders: Dict[str, int] = {}
+        for i, topic in enumerate(topics):
             assigned = False
             for cluster_name, cluster_topics in clusters.items():
-                cluster_words = set(cluster_name.lower().split())
-                if len(words.intersection(cluster_words)) > 0:
+                if matrix[i][founders[cluster_name]] > 0.0:
                     cluster_topics.append(topic)
                     assigned = True
                     break
             if not assigned:
                 clusters[topic] = [topic]
+                founders[topic] = i
         return clusters
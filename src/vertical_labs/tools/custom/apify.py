@@ -1,9 +1,10 @@
 import os
 from typing import Dict, List
 
-import requests
 from crewai.tools import BaseTool
 
+from vertical_labs.http import get_session
+
 
 class ApifyNewsScraper(BaseTool):
     """Tool for fetching news using Ultimate News Scraper."""
@@ -32,7 +33,7 @@ class ApifyNewsScraper(BaseTool):
             raise ValueError("APIFY_API_TOKEN environment variable not set")
 
         url = f"https://api.apify.com/v2/acts/glitch_404~ultimate-news-scraper/run-sync-get-dataset-items?token={api_token}"
-        response = requests.post(
+        response = get_session().post(
             url, json={"keywords": keywords, "dateFrom": start_date, "dateTo": end_date}
         )
         return response.json()
@@ -61,7 +62,7 @@ class ApifyTwitterTrendsScraper(BaseTool):
             raise ValueError("APIFY_API_TOKEN environment variable not set")
 
         url = f"https://api.apify.com/v2/acts/karamelo~twitter-trends-scraper/run-sync-get-dataset-items?token={api_token}"
-        response = requests.post(url, json={"country": country})
+        response = get_session().post(url, json={"country": country})
         return response.json()
 
 
@@ -80,7 +81,7 @@ class ApifyUltimateNewsTool(BaseTool):
         """
         headers = {"Authorization": f'Bearer {os.environ["APIFY_API_KEY"]}'}
 
-        response = requests.post(
+        response = get_session().post(
             "https://api.apify.com/v2/acts/glitch_404~ultimate-news-scraper/runs",
             headers=headers,
             json={"dateRange": date_range},
@@ -4,10 +4,11 @@ import os
 from typing import Any, Dict, Optional, Type
 
 import docker
-import requests
 from crewai_tools import BaseTool
 from pydantic.v1 import BaseModel, Field, root_validator
 
+from vertical_labs.http import get_session
+
 
 class FixedCustomFileWriteToolInputSchema(BaseModel):
     content: str = Field(..., description="The content to write or append to the file")
@@ -123,7 +124,7 @@ class CustomApiTool(BaseTool):
         query_params = {**self.default_query_params, **(query_params or {})}
 
         try:
-            response = requests.request(
+            response = get_session().request(
                 method=method.upper(),
                 url=url,
                 headers=headers,
@@ -1,9 +1,10 @@
 import os
 from typing import Dict, List
 
-import requests
 from crewai.tools import BaseTool
 
+from vertical_labs.http import get_session
+
 
 class DataForSEOGoogleNews(BaseTool):
     """Tool for fetching news from Google News using DataForSEO."""
@@ -37,7 +38,7 @@ class DataForSEOGoogleNews(BaseTool):
             "location_name": "United States",
             "language_name": "English",
         }
-        response = requests.post(url, auth=auth, json=data)
+        response = get_session().post(url, auth=auth, json=data)
         return response.json().get("tasks", [])
 
 
@@ -55,7 +56,7 @@ class DataForSEOToolGoogleNewsV2(BaseTool):
         """
         headers = {"Authorization": f'Basic {os.environ["DATAFORSEO_API_KEY"]}'}
 
-        response = requests.post(
+        response = get_session().post(
             "https://api.dataforseo.com/v3/serp/google/news/live/advanced",
             headers=headers,
             json={"keyword": keyword, "language_code": "en", "location_code": 2840},
@@ -1,9 +1,11 @@
 import os
-from typing import Dict
+from typing import Dict, List
 
-import requests
 from crewai.tools import BaseTool
 
+from vertical_labs.http import get_session
+from vertical_labs.tools._pool import TOOL_POOL
+
 
 class DiffbotWebsiteAnalysis(BaseTool):
     """Tool for analyzing website content using Diffbot."""
@@ -30,9 +32,23 @@ class DiffbotWebsiteAnalysis(BaseTool):
             raise ValueError("DIFFBOT_API_TOKEN environment variable not set")
 
         diffbot_url = f"https://api.diffbot.com/v3/analyze?token={api_token}&url={url}"
-        response = requests.get(diffbot_url)
+        response = get_session().get(diffbot_url)
         return response.json()
 
+    def analyze_many(self, urls: List[str]) -> List[Dict]:
+        """Analyze several URLs concurrently on the shared tool pool.
+
+        Each analysis is an independent remote call, so fanning them out
+        over TOOL_POOL turns N sequential round-trips into roughly one.
+
+        Args:
+            urls: Website URLs to analyze.
+
+        Returns:
+            List of analysis dictionaries, in input order.
+        """
+        return list(TOOL_POOL.map(self._execute, urls))
+
 
 # DiffbotTool
 class DiffbotContentAnalyzer(BaseTool):
@@ -51,7 +67,7 @@ class DiffbotContentAnalyzer(BaseTool):
         """
         headers = {"Authorization": f'Token {os.environ["DIFFBOT_API_KEY"]}'}
 
-        response = requests.get(
+        response = get_session().get(
             f"https://api.diffbot.com/v3/analyze?url={url}", headers=headers
         )
         return response.json()
@@ -0,0 +1 @@
+"""Streamlit UI components for Vertical Labs."""
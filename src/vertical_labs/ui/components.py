@@ -0,0 +1,111 @@
+"""Shared Streamlit components for the content generation dashboard."""
+
+import streamlit as st
+
+STEPS = {
+    1: "Publisher Analysis",
+    2: "Topic Selection",
+    3: "Pitch Selection",
+    4: "Content Generation",
+}
+
+
+def fragment(func=None, *, run_every=None):
+    """Scope reruns to the decorated section when st.fragment is available.
+
+    st.fragment landed in Streamlit 1.33; fall back to a plain function on
+    older versions so the dashboard still runs (with full-page reruns).
+    ``run_every`` re-executes the fragment on a timer, e.g. for polling.
+    """
+    if func is None:
+        return lambda f: fragment(f, run_every=run_every)
+    if hasattr(st, "fragment"):
+        if run_every is not None:
+            return st.fragment(func, run_every=run_every)
+        return st.fragment(func)
+    return func
+
+
+def initialize_session_state():
+    """Initialize session state variables."""
+    if "step" not in st.session_state:
+        st.session_state.step = 1  # 1: Initial Input, 2: Topics, 3: Pitches, 4: Content
+    if "progress" not in st.session_state:
+        st.session_state.progress = {
+            "topics": {"status": "Not Started", "details": []},
+            "content": {"status": "Not Started", "details": []},
+            "pitches": {"status": "Not Started", "details": []},
+        }
+    if "selected_topics" not in st.session_state:
+        st.session_state.selected_topics = []
+    if "selected_pitches" not in st.session_state:
+        st.session_state.selected_pitches = []
+    if "agent_messages" not in st.session_state:
+        st.session_state.agent_messages = []
+    if "terminal_output" not in st.session_state:
+        st.session_state.terminal_output = []
+
+
+def show_step_indicator():
+    """Display the current step in the process."""
+    cols = st.columns(len(STEPS))
+    for step_num, step_name in STEPS.items():
+        with cols[step_num - 1]:
+            if step_num == st.session_state.step:
+                st.markdown(f"**:blue[{step_name}]**")
+            elif step_num < st.session_state.step:
+                st.markdown(f"~~{step_name}~~")
+            else:
+                st.markdown(step_name)
+
+
+def update_progress(stage: str, status: str, detail: str):
+    """Update the progress state in Streamlit."""
+    if stage in st.session_state.progress:
+        st.session_state.progress[stage]["status"] = status
+        st.session_state.progress[stage]["details"].append(detail)
+
+        # Add agent message to conversation
+        if "Agent:" in detail:
+            agent_name = detail.split("Agent:")[1].split("\n")[0].strip()
+            message = detail.split("Task:")[1].strip() if "Task:" in detail else detail
+            st.session_state.agent_messages.append(
+                {"agent": agent_name, "message": message}
+            )
+
+
+@fragment
+def show_agent_conversation():
+    """Display the agent conversation in a chat-like interface."""
+    st.header("Agent Conversation")
+
+    for msg in st.session_state.agent_messages:
+        with st.chat_message(msg["agent"]):
+            st.write(msg["message"])
+
+
+@fragment
+def show_progress():
+    """Show the progress sidebar."""
+    st.header("Progress")
+
+    # Topics Progress
+    st.subheader("Topics Discovery")
+    st.write(f"Status: {st.session_state.progress['topics']['status']}")
+    if st.session_state.progress["topics"]["details"]:
+        for detail in st.session_state.progress["topics"]["details"]:
+            st.write(f"- {detail}")
+
+    # Content Progress
+    st.subheader("Content Generation")
+    st.write(f"Status: {st.session_state.progress['content']['status']}")
+    if st.session_state.progress["content"]["details"]:
+        for detail in st.session_state.progress["content"]["details"]:
+            st.write(f"- {detail}")
+
+    # Pitches Progress
+    st.subheader("Pitch Creation")
+    st.write(f"Status: {st.session_state.progress['pitches']['status']}")
+    if st.session_state.progress["pitches"]["details"]:
+        for detail in st.session_state.progress["pitches"]["details"]:
+            st.write(f"- {detail}")